@@ -0,0 +1,108 @@
+"""
+Numeric kernels for the fuzzy logic system.
+Batch membership sampling and compiled rule aggregation over flat data.
+"""
+import math
+
+
+def triangular_batch(x_values, a, b, c, inv_rise, inv_fall):
+    """
+    Evaluate a triangular membership function over many crisp values.
+
+    Args:
+        x_values: Crisp values, already clamped to the variable's range
+        a, b, c: Left foot, peak and right foot of the triangle
+        inv_rise, inv_fall: Precomputed 1/(b-a) and 1/(c-b)
+
+    Returns:
+        tuple: Membership value for each x, in input order
+    """
+    return tuple(
+        0.0 if x <= a or x >= c
+        else (x - a) * inv_rise if x < b
+        else (c - x) * inv_fall
+        for x in x_values
+    )
+
+
+def trapezoidal_batch(x_values, a, b, c, d):
+    """
+    Evaluate a trapezoidal membership function over many crisp values.
+
+    Args:
+        x_values: Crisp values, already clamped to the variable's range
+        a, b, c, d: Left foot, left shoulder, right shoulder and right foot
+
+    Returns:
+        tuple: Membership value for each x, in input order
+    """
+    return tuple(
+        0.0 if x <= a or x >= d
+        else (x - a) / (b - a) if x < b
+        else 1.0 if x <= c
+        else (d - x) / (d - c)
+        for x in x_values
+    )
+
+
+def gaussian_batch(x_values, center, inv_width, cutoff_sq):
+    """
+    Evaluate a gaussian membership function over many crisp values.
+
+    Args:
+        x_values: Crisp values
+        center: Center of the bell
+        inv_width: Precomputed 1/width
+        cutoff_sq: Squared distance, in widths, past which 0.0 is returned
+
+    Returns:
+        tuple: Membership value for each x, in input order
+    """
+    exp = math.exp
+    t_values = [(x - center) * inv_width for x in x_values]
+    return tuple([
+        0.0 if t * t > cutoff_sq else exp(-0.5 * (t * t))
+        for t in t_values
+    ])
+
+
+def aggregate_rules(memberships, rules_by_trigger, offsets, conditions, any_groups,
+                    weights, out_vars, out_funcs, output_rows):
+    """
+    Fire compiled rules and max-aggregate them into output rows in place.
+
+    Args:
+        memberships: Flat membership values, one per input slot
+        rules_by_trigger: Per slot, the ids of rules whose first condition
+            reads that slot
+        offsets, conditions: CSR condition indices per rule
+        any_groups: Per rule, tuples of slots combined with max
+        weights: Rule weights
+        out_vars, out_funcs: Output row and column per rule
+        output_rows: Zeroed output rows, updated in place
+    """
+    for trigger, rule_ids in zip(memberships, rules_by_trigger):
+        if trigger <= 0 or not rule_ids:
+            continue
+
+        for rule_id in rule_ids:
+            firing_strength = trigger
+            for slot in conditions[offsets[rule_id] + 1:offsets[rule_id + 1]]:
+                membership = memberships[slot]
+                if membership < firing_strength:
+                    firing_strength = membership
+                    if firing_strength <= 0:
+                        break
+            if firing_strength <= 0:
+                continue
+
+            for group in any_groups[rule_id]:
+                group_strength = max([memberships[slot] for slot in group])
+                if group_strength < firing_strength:
+                    firing_strength = group_strength
+
+            firing_strength *= weights[rule_id]
+            row = output_rows[out_vars[rule_id]]
+            out_func = out_funcs[rule_id]
+            if firing_strength > row[out_func]:
+                row[out_func] = firing_strength
@@ -1,9 +1,16 @@
 import random
+from itertools import accumulate
 from src.ai import fsm, fuzzy_logic, pattern_recognition
 from src.core import moves
 from src.utils import utils, config
 
 
+_FUZZY_DIFFICULTY_MODIFIERS = {
+    difficulty: modifiers.get('aggressive', {})
+    for difficulty, modifiers in config.DIFFICULTY_MODIFIERS.items()
+}
+
+
 class AIController:
     """AI controller that uses Fuzzy Logic for intelligent decision-making."""
     
@@ -165,17 +172,13 @@ class AIController:
             return 'rest'
         
         
-        total = sum(available_actions.values())
-        if total > 0:
-            for action in available_actions:
-                available_actions[action] = available_actions[action] / total
+        actions = tuple(available_actions)
+        cum_weights = tuple(accumulate(available_actions.values()))
+        if cum_weights[-1] > 0:
+            selected_action = utils.weighted_choice_fast(actions, cum_weights)
         else:
             
-            for action in available_actions:
-                available_actions[action] = 1.0 / len(available_actions)
-        
-        
-        selected_action = utils.weighted_choice(available_actions)
+            selected_action = random.choices(actions)[0]
         
         
         
@@ -207,9 +210,6 @@ class AIController:
         Returns:
             float: Threat level (0.0 to 1.0)
         """
-        from src.ai import fsm
-        
-        
         opp_health_pct = fsm.calculate_health_percentage(opponent_character)
         opp_stam_pct = fsm.calculate_stamina_percentage(opponent_character)
         
@@ -242,18 +242,11 @@ class AIController:
         Returns:
             dict: Modified action probabilities
         """
-        if self.difficulty not in config.DIFFICULTY_MODIFIERS:
+        modifiers = _FUZZY_DIFFICULTY_MODIFIERS.get(self.difficulty)
+        if modifiers is None:
             return action_probs
         
-        
-        modifiers = config.DIFFICULTY_MODIFIERS[self.difficulty].get('aggressive', {})
-        
-        modified_probs = {}
-        for action, prob in action_probs.items():
-            modifier = modifiers.get(action, 1.0)
-            modified_probs[action] = prob * modifier
-        
-        return modified_probs
+        return {action: prob * modifiers.get(action, 1.0) for action, prob in action_probs.items()}
     
     
     def set_difficulty(self, difficulty):
@@ -37,6 +37,9 @@ STATES = {
 DEFAULT_STATE = STATES['AGGRESSIVE']
 
 
+_DANGEROUS_MASK = sum(config.STATUS_EFFECT_BITS.values()) | config.STATUS_EFFECT_OTHER_BIT
+
+
 def get_state(state_name):
     """
     Get a state object by name.
@@ -130,7 +133,7 @@ def calculate_threat_level(ai_character, opponent_character, last_player_move):
         threat += 0.25
     
     
-    if opponent_character.status_effects:
+    if opponent_character.status_effect_bits & _DANGEROUS_MASK:
         
         threat += 0.1
     
@@ -307,8 +310,29 @@ def should_transition_to_finisher(opponent_character, ai_character=None, ai_stam
     return should_transition, kill_potential
 
 
+def get_history_tails(player_move_history):
+    """
+    Slice the trailing moves used by the pattern checks out of a move history.
+    
+    Args:
+        player_move_history: List (or other sequence) of recent player moves
+        
+    Returns:
+        tuple: (tail2, tail3, tail4) lists of the last 2, 3 and 4 moves
+               (shorter when the history itself is shorter)
+    """
+    if not player_move_history:
+        return [], [], []
+    
+    if not isinstance(player_move_history, list):
+        player_move_history = list(player_move_history)
+    
+    tail4 = player_move_history[-4:]
+    return tail4[-2:], tail4[-3:], tail4
+
+
 def should_transition_to_defensive(last_player_move, consecutive_heavy_attacks=0, threat_level=0.0, 
-                                   player_move_history=None, ai_health_pct=1.0):
+                                   player_move_history=None, ai_health_pct=1.0, tail3=None):
     """
     Advanced check if AI should transition to Defensive state.
     Considers threat level, player patterns, and AI health.
@@ -319,6 +343,7 @@ def should_transition_to_defensive(last_player_move, consecutive_heavy_attacks=0
         threat_level: Current threat level
         player_move_history: Recent player move history
         ai_health_pct: AI health percentage
+        tail3: Precomputed last three moves of the history (optional)
         
     Returns:
         tuple: (should_transition: bool, defensive_urgency: float)
@@ -345,15 +370,11 @@ def should_transition_to_defensive(last_player_move, consecutive_heavy_attacks=0
         defensive_score += 0.1
     
     
-    if player_move_history is None:
-        player_move_history = []
-    
-    if not isinstance(player_move_history, list):
-        player_move_history = list(player_move_history)
+    if tail3 is None:
+        _, tail3, _ = get_history_tails(player_move_history)
     
-    if player_move_history and len(player_move_history) >= 3:
-        recent = player_move_history[-3:]
-        if recent.count('punch') >= 2 and 'special' in recent:
+    if len(tail3) >= 3:
+        if tail3.count('punch') >= 2 and 'special' in tail3:
             defensive_score += 0.15
     
     should_transition = defensive_score >= 0.5
@@ -362,7 +383,8 @@ def should_transition_to_defensive(last_player_move, consecutive_heavy_attacks=0
     return should_transition, defensive_urgency
 
 
-def should_transition_to_counter(player_move_history, min_repeats=2, last_player_move=None):
+def should_transition_to_counter(player_move_history, min_repeats=2, last_player_move=None,
+                                 tail2=None, tail3=None, tail4=None):
     """
     Advanced check if AI should transition to Counter state.
     Detects patterns, sequences, and predictable behavior.
@@ -371,6 +393,7 @@ def should_transition_to_counter(player_move_history, min_repeats=2, last_player
         player_move_history: List of recent player moves
         min_repeats: Minimum number of repeated moves to trigger counter
         last_player_move: Last move player performed
+        tail2, tail3, tail4: Precomputed trailing moves from get_history_tails (optional)
         
     Returns:
         tuple: (should_transition: bool, pattern_strength: float)
@@ -378,33 +401,40 @@ def should_transition_to_counter(player_move_history, min_repeats=2, last_player
     if player_move_history is None:
         player_move_history = []
     
+    if tail4 is None:
+        tail2, tail3, tail4 = get_history_tails(player_move_history)
     
-    if not isinstance(player_move_history, list):
-        player_move_history = list(player_move_history)
-    
-    if len(player_move_history) < min_repeats:
+    history_len = len(player_move_history)
+    if history_len < min_repeats:
         return False, 0.0
     
     pattern_strength = 0.0
     
     
-    last_moves = player_move_history[-min_repeats:]
+    if min_repeats == 2:
+        last_moves = tail2
+    else:
+        last_moves = list(player_move_history)[-min_repeats:]
     if len(set(last_moves)) == 1:
         pattern_strength = 0.8
         
-        if len(player_move_history) >= min_repeats + 1:
-            if player_move_history[-(min_repeats + 1)] == last_moves[0]:
+        if history_len >= min_repeats + 1:
+            if min_repeats == 2:
+                previous_move = tail3[0]
+            else:
+                previous_move = list(player_move_history)[-(min_repeats + 1)]
+            if previous_move == last_moves[0]:
                 pattern_strength = 1.0
     
     
-    if len(player_move_history) >= 4:
-        last_four = player_move_history[-4:]
+    if history_len >= 4:
+        last_four = tail4
         if last_four[0] == last_four[2] and last_four[1] == last_four[3] and last_four[0] != last_four[1]:
             pattern_strength = max(pattern_strength, 0.7)
     
     
-    if len(player_move_history) >= 3:
-        last_three = player_move_history[-3:]
+    if history_len >= 3:
+        last_three = tail3
         
         if set(last_three) == {'block', 'evade'}:
             pattern_strength = max(pattern_strength, 0.6)
@@ -440,6 +470,8 @@ def determine_next_state(current_state, ai_character, opponent_character,
         player_move_history = []
     
     
+    tail2, tail3, tail4 = get_history_tails(player_move_history)
+    
     ai_hp_pct = calculate_health_percentage(ai_character)
     ai_stam_pct = calculate_stamina_percentage(ai_character)
     opp_hp_pct = calculate_health_percentage(opponent_character)
@@ -488,7 +520,8 @@ def determine_next_state(current_state, ai_character, opponent_character,
     
     
     counter_check, pattern_strength = should_transition_to_counter(
-        player_move_history, min_repeats=2, last_player_move=last_player_move
+        player_move_history, min_repeats=2, last_player_move=last_player_move,
+        tail2=tail2, tail3=tail3, tail4=tail4
     )
     if counter_check:
         
@@ -502,7 +535,7 @@ def determine_next_state(current_state, ai_character, opponent_character,
     
     defensive_check, defensive_urgency = should_transition_to_defensive(
         last_player_move, consecutive_heavy_attacks, threat_level,
-        player_move_history, ai_hp_pct
+        player_move_history, ai_hp_pct, tail3=tail3
     )
     if defensive_check:
         defensive_score = defensive_urgency * 5.0
@@ -575,14 +608,18 @@ def determine_next_state(current_state, ai_character, opponent_character,
     
     if current_state == STATES['DEFENSIVE']:
         defensive_check, _ = should_transition_to_defensive(
-            last_player_move, consecutive_heavy_attacks, threat_level, player_move_history, ai_hp_pct
+            last_player_move, consecutive_heavy_attacks, threat_level, player_move_history, ai_hp_pct,
+            tail3=tail3
         )
         if not defensive_check and threat_level < 0.3:
             return STATES['AGGRESSIVE']
         return STATES['DEFENSIVE']
     
     if current_state == STATES['COUNTER']:
-        counter_check, _ = should_transition_to_counter(player_move_history, min_repeats=2, last_player_move=last_player_move)
+        counter_check, _ = should_transition_to_counter(
+            player_move_history, min_repeats=2, last_player_move=last_player_move,
+            tail2=tail2, tail3=tail3, tail4=tail4
+        )
         if not counter_check:
             return STATES['AGGRESSIVE']
         return STATES['COUNTER']
@@ -6,40 +6,185 @@ Uses fuzzy membership functions and rules to determine action probabilities
 based on game state variables (health, stamina, threat, etc.).
 """
 
+import functools
 import math
+import operator
+import types
+from array import array
 from src.utils import config
+from src.ai import _fuzzy_kernels, fsm
 
 
-class FuzzyVariable:
-    """Represents a fuzzy variable with membership functions."""
+INPUT_VARIABLES = (
+    'ai_health', 'ai_stamina', 'opponent_health', 'opponent_stamina',
+    'health_differential', 'threat', 'pattern_strength', 'cooldown_status'
+)
+OUTPUT_VARIABLES = (
+    'punch_prob', 'kick_prob', 'special_prob', 'block_prob', 'evade_prob', 'rest_prob'
+)
+OUTPUT_ACTIONS = ('punch', 'kick', 'special', 'block', 'evade', 'rest')
+
+
+_THREAT_DELTA = {'special': 0.3, 'punch': 0.1, 'rest': -0.2}
+
+
+_ONE_INDEX = 0
+_ZERO_INDEX = 1
+
+
+def _quantize(value):
+    """
+    Round a crisp input to the nearest 1/config.FUZZY_INPUT_QUANTIZATION.
+    
+    Off (0) by default: rounding can land an input exactly on a membership
+    endpoint, where triangular functions are 0, and switch rules off.
+    """
+    steps = config.FUZZY_INPUT_QUANTIZATION
+    if not steps:
+        return value
+    return round(value * steps) / steps
+
+MF_TRIANGULAR = 0
+MF_TRAPEZOIDAL = 1
+MF_GAUSSIAN = 2
+MF_UNKNOWN = 3
+
+_MEMBERSHIP_TYPE_IDS = {
+    'triangular': MF_TRIANGULAR,
+    'trapezoidal': MF_TRAPEZOIDAL,
+    'gaussian': MF_GAUSSIAN
+}
+
+
+def _triangular(value, a, b, c, inv_rise, inv_fall):
+    """
+    Triangular membership at an already clamped crisp value.
+    
+    inv_rise and inv_fall are 1/(b-a) and 1/(c-b), precomputed when the
+    function is added; a degenerate side never reaches its multiply.
+    """
+    if value <= a or value >= c:
+        return 0.0
+    elif value < b:
+        return (value - a) * inv_rise
+    else:
+        return (c - value) * inv_fall
+
+
+def _trapezoidal(value, a, b, c, d):
+    """Trapezoidal membership at an already clamped crisp value."""
+    if value <= a or value >= d:
+        return 0.0
+    elif a < value < b:
+        return (value - a) / (b - a) if b != a else 1.0
+    elif b <= value <= c:
+        return 1.0
+    else:  
+        return (d - value) / (d - c) if d != c else 1.0
+
+
+_GAUSSIAN_CUTOFF_SQ = 6.0 ** 2
+
+
+def _gaussian(value, center, width, inv_width):
+    """
+    Gaussian membership at a crisp value; inv_width is 1/width.
     
-    def __init__(self, name, min_val, max_val):
+    Beyond six widths from the center the membership is below 2e-8 and is
+    returned as 0.0 without calling exp.
+    """
+    t = (value - center) * inv_width
+    t_sq = t * t
+    if t_sq > _GAUSSIAN_CUTOFF_SQ:
+        return 0.0
+    return math.exp(-0.5 * t_sq)
+
+
+def _unknown(value, *params):
+    """Membership for unsupported function types."""
+    return 0.0
+
+
+_MEMBERSHIP_DISPATCH = (_triangular, _trapezoidal, _gaussian, _unknown)
+
+
+def _index_array(values):
+    """Pack non-negative indices into the narrowest unsigned array that holds them."""
+    largest = max(values, default=0)
+    for typecode in ('B', 'H', 'I', 'L'):
+        if largest < 1 << (8 * array(typecode).itemsize):
+            return array(typecode, values)
+    return array('Q', values)
+
+
+class MembershipSpec:
+    """Membership functions and sample caches over a value range, shareable between variables."""
+    
+    __slots__ = (
+        'min_val', 'max_val', 'membership_functions', 'func_names', '_mf_table',
+        '_tri_params', '_sample_points', '_sample_matrix', '_mfs_disjoint'
+    )
+    
+    def __init__(self, min_val, max_val):
         """
-        Initialize a fuzzy variable.
+        Initialize a membership spec.
         
         Args:
-            name: Name of the variable
             min_val: Minimum possible value
             max_val: Maximum possible value
         """
-        self.name = name
         self.min_val = min_val
         self.max_val = max_val
         self.membership_functions = {}
+        self.func_names = ()
+        self._mf_table = ()
+        self._tri_params = ()
+        self._sample_points = {}
+        self._sample_matrix = {}
+        self._mfs_disjoint = False
     
     def add_membership_function(self, name, func_type, params):
         """
-        Add a membership function to this variable.
+        Add a membership function to this spec.
         
         Args:
             name: Name of the membership function (e.g., 'low', 'medium', 'high')
             func_type: Type of function ('triangular', 'trapezoidal', 'gaussian')
             params: Parameters for the function
         """
-        self.membership_functions[name] = {
-            'type': func_type,
-            'params': params
-        }
+        type_id = _MEMBERSHIP_TYPE_IDS.get(func_type, MF_UNKNOWN)
+        if type_id == MF_TRIANGULAR:
+            a, b, c = params
+            inv_rise = 1.0 / (b - a) if b != a else 0.0
+            inv_fall = 1.0 / (c - b) if c != b else 0.0
+            params = (a, b, c, inv_rise, inv_fall)
+        elif type_id == MF_GAUSSIAN:
+            center, width = params
+            params = (center, width, 1.0 / width)
+        self.membership_functions[name] = (type_id, *params)
+        self.func_names = tuple(self.membership_functions)
+        self._mf_table = tuple(
+            (_MEMBERSHIP_DISPATCH[func[0]], func[1:])
+            for func in self.membership_functions.values()
+        )
+        
+        if all(func[0] == MF_TRIANGULAR for func in self.membership_functions.values()):
+            self._tri_params = tuple(func[1:] for func in self.membership_functions.values())
+        else:
+            self._tri_params = None
+        self._sample_matrix.clear()
+        self._mfs_disjoint = self._check_disjoint()
+    
+    def _check_disjoint(self):
+        """Check whether all functions are triangles with non-overlapping supports."""
+        supports = []
+        for func in self.membership_functions.values():
+            if func[0] != MF_TRIANGULAR:
+                return False
+            supports.append((func[1], func[3]))
+        
+        supports.sort()
+        return all(prev[1] <= cur[0] for prev, cur in zip(supports, supports[1:]))
     
     def get_membership(self, value, func_name):
         """
@@ -55,39 +200,221 @@ class FuzzyVariable:
         if func_name not in self.membership_functions:
             return 0.0
         
-        func = self.membership_functions[func_name]
-        func_type = func['type']
-        params = func['params']
+        type_id, *params = self.membership_functions[func_name]
+        
+        
+        min_val, max_val = self.min_val, self.max_val
+        value = min_val if value < min_val else max_val if value > max_val else value
+        return _MEMBERSHIP_DISPATCH[type_id](value, *params)
+    
+    def get_sample_points(self, num_samples=100):
+        """
+        Get the evenly spaced grid used to sample this variable's range.
+        
+        Args:
+            num_samples: Number of intervals in the grid (num_samples + 1 points)
+            
+        Returns:
+            tuple: Crisp x values from min_val to max_val
+        """
+        points = self._sample_points.get(num_samples)
+        if points is None:
+            step = (self.max_val - self.min_val) / num_samples
+            points = tuple(self.min_val + i * step for i in range(num_samples + 1))
+            self._sample_points[num_samples] = points
+        return points
+    
+    def get_sample_matrix(self, num_samples=100):
+        """
+        Get every membership function sampled over the variable's grid.
+        
+        The matrix only depends on the membership functions, so it is built
+        once and reused until another function is added. Rows are stored as
+        single-precision arrays; memberships need nowhere near double precision.
+        
+        Args:
+            num_samples: Number of intervals in the grid (num_samples + 1 points)
+            
+        Returns:
+            dict: {func_name: array('f') of membership values at each grid point}
+        """
+        matrix = self._sample_matrix.get(num_samples)
+        if matrix is None:
+            x_values = self.get_sample_points(num_samples)
+            min_val, max_val = self.min_val, self.max_val
+            clamped = tuple(
+                min_val if x < min_val else max_val if x > max_val else x
+                for x in x_values
+            )
+            
+            matrix = {}
+            for func_name, func in self.membership_functions.items():
+                if func[0] == MF_TRIANGULAR:
+                    row = _fuzzy_kernels.triangular_batch(clamped, *func[1:])
+                elif func[0] == MF_TRAPEZOIDAL:
+                    row = _fuzzy_kernels.trapezoidal_batch(clamped, *func[1:])
+                elif func[0] == MF_GAUSSIAN:
+                    center, width, inv_width = func[1:]
+                    row = _fuzzy_kernels.gaussian_batch(
+                        clamped, center, inv_width, _GAUSSIAN_CUTOFF_SQ
+                    )
+                else:
+                    row = [self.get_membership(x, func_name) for x in x_values]
+                matrix[func_name] = array('f', row)
+            self._sample_matrix[num_samples] = matrix
+        return matrix
+    
+    def precompute_basis(self, num_samples=100):
+        """Build the sample grid and matrix ahead of the first defuzzification."""
+        self.get_sample_points(num_samples)
+        self.get_sample_matrix(num_samples)
+    
+    def centroid(self, levels, num_samples=100):
+        """
+        Centroid of the union of this variable's functions, each clipped.
         
+        Args:
+            levels: Clip level per function, ordered like self.func_names
+            num_samples: Number of intervals in the sampling grid
+            
+        Returns:
+            float: Crisp centroid, or 0.0 if every level is zero
+        """
+        return self.centroids((levels,), num_samples)[0]
+    
+    def centroids(self, level_rows, num_samples=100):
+        """
+        Centroids for several sets of clip levels over the same functions.
         
-        value = max(self.min_val, min(self.max_val, value))
+        The grid and sample matrix are fetched once for the whole batch.
         
-        if func_type == 'triangular':
-            a, b, c = params  
-            if value <= a or value >= c:
-                return 0.0
-            elif value < b:
-                return (value - a) / (b - a) if b != a else 1.0
+        Args:
+            level_rows: Iterable of clip-level sequences, each ordered like
+                self.func_names
+            num_samples: Number of intervals in the sampling grid
+            
+        Returns:
+            list: Crisp centroid per row (0.0 where every level is zero)
+        """
+        if self._mfs_disjoint:
+            return [self._triangular_centroid(levels) for levels in level_rows]
+        
+        x_values = self.get_sample_points(num_samples)
+        sample_rows = tuple(self.get_sample_matrix(num_samples).values())
+        
+        results = []
+        for levels in level_rows:
+            clipped_rows = [
+                [m if m < level else level for m in sample_row]
+                for sample_row, level in zip(sample_rows, levels)
+                if level > 0
+            ]
+            if not clipped_rows:
+                results.append(0.0)
+                continue
+            
+            if len(clipped_rows) == 1:
+                aggregated = clipped_rows[0]
             else:
-                return (c - value) / (c - b) if c != b else 1.0
-        
-        elif func_type == 'trapezoidal':
-            a, b, c, d = params  
-            if value <= a or value >= d:
-                return 0.0
-            elif a < value < b:
-                return (value - a) / (b - a) if b != a else 1.0
-            elif b <= value <= c:
-                return 1.0
-            else:  
-                return (d - value) / (d - c) if d != c else 1.0
-        
-        elif func_type == 'gaussian':
-            center, width = params
-            return math.exp(-0.5 * ((value - center) / width) ** 2)
+                aggregated = [max(column) for column in zip(*clipped_rows)]
+            
+            total_area = sum(aggregated)
+            if total_area > 0:
+                results.append(sum(map(operator.mul, x_values, aggregated)) / total_area)
+            else:
+                results.append(0.0)
+        
+        return results
+    
+    def _triangular_centroid(self, levels):
+        """
+        Exact centroid of disjoint triangles clipped at the given levels.
         
+        A triangle (a, b, c) clipped at h is the full triangle minus the
+        similar triangle above h, whose feet are p = a + h(b - a) and
+        q = c - h(c - b).
+        """
+        total_area = 0.0
+        weighted_sum = 0.0
+        for func, level in zip(self.membership_functions.values(), levels):
+            if level <= 0:
+                continue
+            
+            h = level if level < 1.0 else 1.0
+            _, a, b, c, _, _ = func
+            half_width = (c - a) / 2
+            cut = (1.0 - h) ** 2
+            p = a + h * (b - a)
+            q = c - h * (c - b)
+            
+            total_area += half_width * (1.0 - cut)
+            weighted_sum += half_width * ((a + b + c) - cut * (p + b + q)) / 3
+        
+        if total_area > 0:
+            return weighted_sum / total_area
         return 0.0
     
+    def fuzzify_values(self, value):
+        """
+        Convert a crisp value to membership values for all functions at once.
+        
+        Args:
+            value: Crisp input value
+            
+        Returns:
+            tuple: Membership values ordered like self.func_names
+        """
+        min_val, max_val = self.min_val, self.max_val
+        value = min_val if value < min_val else max_val if value > max_val else value
+        
+        if self._tri_params is not None:
+            return tuple([
+                0.0 if value <= a or value >= c
+                else (value - a) * inv_rise if value < b
+                else (c - value) * inv_fall
+                for a, b, c, inv_rise, inv_fall in self._tri_params
+            ])
+        
+        return tuple(
+            kernel(value, *params)
+            for kernel, params in self._mf_table
+        )
+    
+    def fuzzify_many(self, values):
+        """
+        Convert several crisp values to membership rows in one pass.
+        
+        Used when more than one input variable shares this spec.
+        
+        Args:
+            values: Crisp input values
+            
+        Returns:
+            list: One tuple per value, ordered like self.func_names
+        """
+        min_val, max_val = self.min_val, self.max_val
+        values = [
+            min_val if value < min_val else max_val if value > max_val else value
+            for value in values
+        ]
+        
+        if self._tri_params is not None:
+            return [
+                tuple([
+                    0.0 if value <= a or value >= c
+                    else (value - a) * inv_rise if value < b
+                    else (c - value) * inv_fall
+                    for a, b, c, inv_rise, inv_fall in self._tri_params
+                ])
+                for value in values
+            ]
+        
+        mf_table = self._mf_table
+        return [
+            tuple([kernel(value, *params) for kernel, params in mf_table])
+            for value in values
+        ]
+    
     def fuzzify(self, value):
         """
         Convert a crisp value to fuzzy membership values.
@@ -98,25 +425,93 @@ class FuzzyVariable:
         Returns:
             dict: Dictionary of membership values for each function
         """
-        result = {}
-        for func_name in self.membership_functions:
-            result[func_name] = self.get_membership(value, func_name)
-        return result
+        return dict(zip(self.func_names, self.fuzzify_values(value)))
+
+
+class FuzzyVariable:
+    """Represents a named fuzzy variable bound to a membership spec."""
+    
+    __slots__ = ('name', 'spec')
+    
+    def __init__(self, name, min_val, max_val, spec=None):
+        """
+        Initialize a fuzzy variable.
+        
+        Args:
+            name: Name of the variable
+            min_val: Minimum possible value
+            max_val: Maximum possible value
+            spec: MembershipSpec shared with other variables (new one if None)
+        """
+        if spec is None:
+            spec = MembershipSpec(min_val, max_val)
+        elif (spec.min_val, spec.max_val) != (min_val, max_val):
+            raise ValueError(f"Spec range does not match variable '{name}'")
+        
+        self.name = name
+        self.spec = spec
+    
+    @property
+    def min_val(self):
+        return self.spec.min_val
+    
+    @property
+    def max_val(self):
+        return self.spec.max_val
+    
+    @property
+    def membership_functions(self):
+        return self.spec.membership_functions
+    
+    @property
+    def func_names(self):
+        return self.spec.func_names
+    
+    def add_membership_function(self, name, func_type, params):
+        """Add a membership function to the underlying spec."""
+        self.spec.add_membership_function(name, func_type, params)
+    
+    def get_membership(self, value, func_name):
+        """Get membership value for a given crisp value."""
+        return self.spec.get_membership(value, func_name)
+    
+    def get_sample_points(self, num_samples=100):
+        """Get the evenly spaced grid used to sample this variable's range."""
+        return self.spec.get_sample_points(num_samples)
+    
+    def get_sample_matrix(self, num_samples=100):
+        """Get every membership function sampled over the variable's grid."""
+        return self.spec.get_sample_matrix(num_samples)
+    
+    def centroid(self, levels, num_samples=100):
+        """Centroid of the union of this variable's functions, each clipped."""
+        return self.spec.centroid(levels, num_samples)
+    
+    def fuzzify_values(self, value):
+        """Convert a crisp value to membership values for all functions at once."""
+        return self.spec.fuzzify_values(value)
+    
+    def fuzzify(self, value):
+        """Convert a crisp value to fuzzy membership values."""
+        return self.spec.fuzzify(value)
 
 
 class FuzzyRule:
     """Represents a fuzzy rule (IF-THEN statement)."""
     
+    __slots__ = ('conditions', 'conclusion', 'weight')
+    
     def __init__(self, conditions, conclusion, weight=1.0):
         """
         Initialize a fuzzy rule.
         
         Args:
-            conditions: List of (variable, membership_func) tuples for IF part
+            conditions: List of (variable, membership_func) tuples for IF part;
+                membership_func may be a tuple of names, matched if any of them is
             conclusion: (variable, membership_func) tuple for THEN part
             weight: Rule weight (0.0 to 1.0)
         """
-        self.conditions = conditions  
+        self.conditions = tuple(conditions)
         self.conclusion = conclusion  
         self.weight = weight
     
@@ -130,53 +525,72 @@ class FuzzyRule:
         Returns:
             float: Firing strength of the rule (0.0 to 1.0)
         """
-        if not self.conditions:
-            return self.weight
+        conditions, weight = self.conditions, self.weight
+        if not conditions:
+            return weight
         
         
         firing_strength = 1.0
-        for var_name, func_name in self.conditions:
-            if var_name in fuzzy_values:
-                membership = fuzzy_values[var_name].get(func_name, 0.0)
-                firing_strength = min(firing_strength, membership)
-            else:
+        for var_name, func_name in conditions:
+            values = fuzzy_values.get(var_name)
+            if values is None:
                 return 0.0  
+            
+            if func_name.__class__ is str:
+                membership = values.get(func_name, 0.0)
+            else:
+                membership = max([values.get(name, 0.0) for name in func_name])
+            if membership < firing_strength:
+                if membership <= 0:
+                    return 0.0
+                firing_strength = membership
         
-        return firing_strength * self.weight
+        return firing_strength * weight
 
 
 class FuzzyLogicSystem:
     """Main fuzzy logic system for AI decision-making."""
     
+    __slots__ = (
+        'variables', 'rules', '_input_offsets', '_rule_offsets', '_rules_by_trigger',
+        '_rule_conditions', '_rule_any_groups', '_rule_weights',
+        '_rule_out_var', '_rule_out_func', '_input_specs', '_output_specs',
+        '_shared_output_spec', '_output_rows', '_output_zero_rows', '_mf_center',
+        '_spec_groups', '_last_crisp', '_membership_rows', '_compute_cached'
+    )
+    
     def __init__(self):
         """Initialize the fuzzy logic system with variables and rules."""
         self.variables = {}
         self.rules = []
         self._setup_variables()
         self._setup_rules()
+        self._compile_rules()
+        self.variables = types.MappingProxyType(self.variables)
+        self._compute_cached = functools.lru_cache(maxsize=4096)(self._compute_probabilities)
     
     def _setup_variables(self):
         """Set up fuzzy variables with membership functions."""
         
         
-        health = FuzzyVariable('health', 0.0, 1.0)
+        health = MembershipSpec(0.0, 1.0)
         health.add_membership_function('very_low', 'triangular', (0.0, 0.0, 0.2))
         health.add_membership_function('low', 'triangular', (0.1, 0.3, 0.5))
         health.add_membership_function('medium', 'triangular', (0.4, 0.6, 0.8))
         health.add_membership_function('high', 'triangular', (0.7, 0.9, 1.0))
         health.add_membership_function('very_high', 'triangular', (0.8, 1.0, 1.0))
-        self.variables['ai_health'] = health
-        self.variables['opponent_health'] = health  
+        self.variables['ai_health'] = FuzzyVariable('ai_health', 0.0, 1.0, health)
+        self.variables['opponent_health'] = FuzzyVariable('opponent_health', 0.0, 1.0, health)
         
         
-        stamina = FuzzyVariable('stamina', 0.0, 1.0)
+        stamina = MembershipSpec(0.0, 1.0)
         stamina.add_membership_function('very_low', 'triangular', (0.0, 0.0, 0.25))
         stamina.add_membership_function('low', 'triangular', (0.15, 0.35, 0.55))
         stamina.add_membership_function('medium', 'triangular', (0.45, 0.65, 0.85))
         stamina.add_membership_function('high', 'triangular', (0.75, 0.9, 1.0))
         stamina.add_membership_function('very_high', 'triangular', (0.9, 1.0, 1.0))
-        self.variables['ai_stamina'] = stamina
-        self.variables['opponent_stamina'] = stamina
+        self.variables['ai_stamina'] = FuzzyVariable('ai_stamina', 0.0, 1.0, stamina)
+        self.variables['opponent_stamina'] = FuzzyVariable('opponent_stamina', 0.0, 1.0, stamina)
         
         
         health_diff = FuzzyVariable('health_differential', -1.0, 1.0)
@@ -211,19 +625,16 @@ class FuzzyLogicSystem:
         self.variables['cooldown_status'] = cooldown
         
         
-        action_prob = FuzzyVariable('action_probability', 0.0, 1.0)
+        action_prob = MembershipSpec(0.0, 1.0)
         action_prob.add_membership_function('very_low', 'triangular', (0.0, 0.0, 0.25))
         action_prob.add_membership_function('low', 'triangular', (0.15, 0.35, 0.55))
         action_prob.add_membership_function('medium', 'triangular', (0.45, 0.65, 0.85))
         action_prob.add_membership_function('high', 'triangular', (0.75, 0.9, 1.0))
         action_prob.add_membership_function('very_high', 'triangular', (0.9, 1.0, 1.0))
+        action_prob.precompute_basis(100)
         
-        self.variables['punch_prob'] = action_prob
-        self.variables['kick_prob'] = action_prob
-        self.variables['special_prob'] = action_prob
-        self.variables['block_prob'] = action_prob
-        self.variables['evade_prob'] = action_prob
-        self.variables['rest_prob'] = action_prob
+        for var_name in OUTPUT_VARIABLES:
+            self.variables[var_name] = FuzzyVariable(var_name, 0.0, 1.0, action_prob)
     
     def _setup_rules(self):
         """Set up fuzzy rules for decision-making."""
@@ -377,17 +788,7 @@ class FuzzyLogicSystem:
         
         
         self.rules.append(FuzzyRule(
-            [('opponent_health', 'very_low'), ('ai_stamina', 'medium')],
-            ('punch_prob', 'very_high'),
-            weight=1.0
-        ))
-        self.rules.append(FuzzyRule(
-            [('opponent_health', 'very_low'), ('ai_stamina', 'high')],
-            ('punch_prob', 'very_high'),
-            weight=1.0
-        ))
-        self.rules.append(FuzzyRule(
-            [('opponent_health', 'very_low'), ('ai_stamina', 'very_high')],
+            [('opponent_health', 'very_low'), ('ai_stamina', ('medium', 'high', 'very_high'))],
             ('punch_prob', 'very_high'),
             weight=1.0
         ))
@@ -416,6 +817,128 @@ class FuzzyLogicSystem:
             weight=0.9
         ))
     
+    def _compile_rules(self):
+        """
+        Compile the rule base into a flat structure-of-arrays table.
+        
+        Every (variable, function) pair of the input variables gets a slot in
+        a flat membership list; slot 0 always holds 1.0 and slot 1 always
+        holds 0.0 (used for conditions on unknown variables or functions).
+        
+        Rule i's conditions are _rule_conditions[_rule_offsets[i]:_rule_offsets[i + 1]]
+        (CSR layout; a rule with no plain conditions gets the 1.0 slot).
+        Any-of conditions are kept as separate index groups; weights and
+        conclusions live in parallel arrays.
+        
+        _rules_by_trigger maps each membership slot to the rules whose first
+        condition reads it, so rules whose first condition is zero are never
+        visited.
+        """
+        self._input_offsets = {}
+        offset = 2
+        for var_name in INPUT_VARIABLES:
+            self._input_offsets[var_name] = offset
+            offset += len(self.variables[var_name].func_names)
+        
+        rules = [
+            (rule.conditions, rule.conclusion, rule.weight)
+            for rule in self.rules
+            if rule.conclusion[0] in OUTPUT_VARIABLES
+        ]
+        
+        rule_offsets = [0]
+        rule_conditions = []
+        rule_out_var = []
+        rule_out_func = []
+        self._rule_any_groups = []
+        self._rule_weights = array('d')
+        
+        for conditions, conclusion, weight in rules:
+            cond_idx = [
+                self._membership_index(var_name, func_name)
+                for var_name, func_name in conditions
+                if isinstance(func_name, str)
+            ] or [_ONE_INDEX]
+            rule_conditions.extend(cond_idx)
+            rule_offsets.append(len(rule_conditions))
+            
+            self._rule_any_groups.append(tuple(
+                tuple(self._membership_index(var_name, name) for name in func_name)
+                for var_name, func_name in conditions
+                if not isinstance(func_name, str)
+            ))
+            
+            var_name, func_name = conclusion
+            self._rule_weights.append(weight)
+            rule_out_var.append(OUTPUT_VARIABLES.index(var_name))
+            rule_out_func.append(self.variables[var_name].func_names.index(func_name))
+        
+        self._rule_offsets = _index_array(rule_offsets)
+        self._rule_conditions = _index_array(rule_conditions)
+        self._rule_out_var = _index_array(rule_out_var)
+        self._rule_out_func = _index_array(rule_out_func)
+        self._rule_any_groups = tuple(self._rule_any_groups)
+        
+        rules_by_trigger = [[] for _ in range(offset)]
+        for rule_id, start in enumerate(self._rule_offsets[:-1]):
+            rules_by_trigger[self._rule_conditions[start]].append(rule_id)
+        self._rules_by_trigger = tuple(tuple(rule_ids) for rule_ids in rules_by_trigger)
+        
+        self._input_specs = tuple(self.variables[var_name].spec for var_name in INPUT_VARIABLES)
+        spec_groups = {}
+        for i, spec in enumerate(self._input_specs):
+            spec_groups.setdefault(id(spec), (spec, []))[1].append(i)
+        self._spec_groups = tuple(
+            (spec, tuple(indices)) for spec, indices in spec_groups.values()
+        )
+        self._output_specs = tuple(self.variables[var_name].spec for var_name in OUTPUT_VARIABLES)
+        if len(set(map(id, self._output_specs))) == 1:
+            self._shared_output_spec = self._output_specs[0]
+        else:
+            self._shared_output_spec = None
+        self._output_zero_rows = tuple(
+            (0.0,) * len(self.variables[var_name].func_names)
+            for var_name in OUTPUT_VARIABLES
+        )
+        self._output_rows = [list(zero_row) for zero_row in self._output_zero_rows]
+        
+        
+        self._last_crisp = [None] * len(INPUT_VARIABLES)
+        self._membership_rows = [()] * len(INPUT_VARIABLES)
+        
+        
+        self._mf_center = {
+            (var_name, func_name): func[2]
+            for var_name, var in self.variables.items()
+            for func_name, func in var.membership_functions.items()
+            if func[0] == MF_TRIANGULAR
+        }
+    
+    def _membership_index(self, var_name, func_name):
+        """Get the flat membership index of an input (variable, function) pair."""
+        if var_name not in self._input_offsets:
+            return _ZERO_INDEX
+        
+        func_names = self.variables[var_name].func_names
+        if func_name not in func_names:
+            return _ZERO_INDEX
+        
+        return self._input_offsets[var_name] + func_names.index(func_name)
+    
+    def _crisp_inputs(self, ai_character, opponent_character, threat_level,
+                      pattern_strength, cooldown_ratio):
+        """Get the crisp input values in INPUT_VARIABLES order."""
+        return (
+            fsm.calculate_health_percentage(ai_character),
+            fsm.calculate_stamina_percentage(ai_character),
+            fsm.calculate_health_percentage(opponent_character),
+            fsm.calculate_stamina_percentage(opponent_character),
+            fsm.calculate_health_differential(ai_character, opponent_character),
+            threat_level,
+            pattern_strength,
+            cooldown_ratio
+        )
+    
     def fuzzify_inputs(self, ai_character, opponent_character, threat_level=0.5, 
                        pattern_strength=0.0, cooldown_ratio=1.0):
         """
@@ -431,27 +954,67 @@ class FuzzyLogicSystem:
         Returns:
             dict: Fuzzy membership values for all input variables
         """
-        from src.ai import fsm
-        
-        ai_health_pct = fsm.calculate_health_percentage(ai_character)
-        ai_stam_pct = fsm.calculate_stamina_percentage(ai_character)
-        opp_health_pct = fsm.calculate_health_percentage(opponent_character)
-        opp_stam_pct = fsm.calculate_stamina_percentage(opponent_character)
-        health_diff = fsm.calculate_health_differential(ai_character, opponent_character)
+        crisp_values = self._crisp_inputs(
+            ai_character, opponent_character, threat_level,
+            pattern_strength, cooldown_ratio
+        )
         
         fuzzy_values = {
-            'ai_health': self.variables['ai_health'].fuzzify(ai_health_pct),
-            'ai_stamina': self.variables['ai_stamina'].fuzzify(ai_stam_pct),
-            'opponent_health': self.variables['opponent_health'].fuzzify(opp_health_pct),
-            'opponent_stamina': self.variables['opponent_stamina'].fuzzify(opp_stam_pct),
-            'health_differential': self.variables['health_differential'].fuzzify(health_diff),
-            'threat': self.variables['threat'].fuzzify(threat_level),
-            'pattern_strength': self.variables['pattern_strength'].fuzzify(pattern_strength),
-            'cooldown_status': self.variables['cooldown_status'].fuzzify(cooldown_ratio)
+            var_name: self.variables[var_name].fuzzify(value)
+            for var_name, value in zip(INPUT_VARIABLES, crisp_values)
         }
         
         return fuzzy_values
     
+    def fuzzify_inputs_flat(self, ai_character, opponent_character, threat_level=0.5,
+                            pattern_strength=0.0, cooldown_ratio=1.0):
+        """
+        Convert crisp game state values to a flat membership list.
+        
+        Same inputs as fuzzify_inputs, but the result is laid out by the
+        indices assigned in _compile_rules.
+        
+        Returns:
+            list: Flat membership values for all input variables
+        """
+        crisp_values = self._crisp_inputs(
+            ai_character, opponent_character, threat_level,
+            pattern_strength, cooldown_ratio
+        )
+        
+        return self._fuzzify_crisp(crisp_values)
+    
+    def _fuzzify_crisp(self, crisp_values):
+        """
+        Fuzzify crisp values given in INPUT_VARIABLES order into a flat list.
+        
+        Each variable's membership row is kept between calls and only
+        recomputed when its crisp value differs from the previous one.
+        Variables sharing a spec are refuzzified together in one call.
+        """
+        last_crisp = self._last_crisp
+        membership_rows = self._membership_rows
+        for spec, indices in self._spec_groups:
+            changed = [i for i in indices if crisp_values[i] != last_crisp[i]]
+            if not changed:
+                continue
+            
+            if len(changed) == 1:
+                i = changed[0]
+                membership_rows[i] = spec.fuzzify_values(crisp_values[i])
+            else:
+                rows = spec.fuzzify_many([crisp_values[i] for i in changed])
+                for i, row in zip(changed, rows):
+                    membership_rows[i] = row
+            for i in changed:
+                last_crisp[i] = crisp_values[i]
+        
+        memberships = [1.0, 0.0]
+        for row in membership_rows:
+            memberships.extend(row)
+        
+        return memberships
+    
     def evaluate_rules(self, fuzzy_values):
         """
         Evaluate all fuzzy rules and get output membership values.
@@ -462,23 +1025,62 @@ class FuzzyLogicSystem:
         Returns:
             dict: Dictionary of output membership values for each action
         """
-        output_memberships = {
-            'punch_prob': {},
-            'kick_prob': {},
-            'special_prob': {},
-            'block_prob': {},
-            'evade_prob': {},
-            'rest_prob': {}
-        }
+        memberships = [1.0, 0.0]
+        for var_name in INPUT_VARIABLES:
+            values = fuzzy_values.get(var_name, {})
+            memberships.extend(
+                values.get(func_name, 0.0)
+                for func_name in self.variables[var_name].func_names
+            )
+        
+        return self.evaluate_rules_flat(memberships)
+    
+    def _aggregate_rules(self, memberships):
+        """
+        Fire the compiled rules into the preallocated output rows.
         
-        for rule in self.rules:
-            firing_strength = rule.evaluate(fuzzy_values)
-            if firing_strength > 0:
-                var_name, func_name = rule.conclusion
-                if var_name in output_memberships:
-                    
-                    current = output_memberships[var_name].get(func_name, 0.0)
-                    output_memberships[var_name][func_name] = max(current, firing_strength)
+        The rows are reused between calls, so callers must read them before
+        evaluating again.
+        
+        Args:
+            memberships: Flat membership values from fuzzify_inputs_flat
+            
+        Returns:
+            list: One row of membership levels per output variable, ordered
+                like OUTPUT_VARIABLES and that variable's func_names
+        """
+        output_rows = self._output_rows
+        for row, zero_row in zip(output_rows, self._output_zero_rows):
+            row[:] = zero_row
+        
+        _fuzzy_kernels.aggregate_rules(
+            memberships, self._rules_by_trigger, self._rule_offsets,
+            self._rule_conditions, self._rule_any_groups, self._rule_weights,
+            self._rule_out_var, self._rule_out_func, output_rows
+        )
+        
+        return output_rows
+    
+    def evaluate_rules_flat(self, memberships):
+        """
+        Evaluate the compiled rules against a flat membership list.
+        
+        Args:
+            memberships: Flat membership values from fuzzify_inputs_flat
+            
+        Returns:
+            dict: Dictionary of output membership values for each action
+        """
+        output_rows = self._aggregate_rules(memberships)
+        
+        output_memberships = {}
+        for var_name, row in zip(OUTPUT_VARIABLES, output_rows):
+            func_names = self.variables[var_name].func_names
+            output_memberships[var_name] = {
+                func_name: value
+                for func_name, value in zip(func_names, row)
+                if value > 0
+            }
         
         return output_memberships
     
@@ -502,29 +1104,9 @@ class FuzzyLogicSystem:
             
             if method == 'centroid':
                 
-                total_area = 0.0
-                weighted_sum = 0.0
-                
                 var = self.variables[var_name]
-                
-                num_samples = 100
-                step = (var.max_val - var.min_val) / num_samples
-                
-                for i in range(num_samples + 1):
-                    x = var.min_val + i * step
-                    
-                    max_membership = 0.0
-                    for func_name, membership_value in memberships.items():
-                        membership = var.get_membership(x, func_name)
-                        max_membership = max(max_membership, min(membership, membership_value))
-                    
-                    total_area += max_membership
-                    weighted_sum += x * max_membership
-                
-                if total_area > 0:
-                    results[var_name] = weighted_sum / total_area
-                else:
-                    results[var_name] = 0.0
+                levels = [memberships.get(func_name, 0.0) for func_name in var.func_names]
+                results[var_name] = var.centroid(levels, 100)
             
             elif method == 'max':
                 
@@ -537,18 +1119,30 @@ class FuzzyLogicSystem:
                 
                 if best_func:
                     
-                    var = self.variables[var_name]
-                    func = var.membership_functions[best_func]
-                    if func['type'] == 'triangular':
-                        _, center, _ = func['params']
-                        results[var_name] = center
-                    else:
-                        results[var_name] = max_value
+                    results[var_name] = self._mf_center.get((var_name, best_func), max_value)
                 else:
                     results[var_name] = 0.0
         
         return results
     
+    def defuzzify_rows(self, output_rows):
+        """
+        Centroid-defuzzify output rows from _aggregate_rules.
+        
+        Args:
+            output_rows: Membership levels per output variable
+            
+        Returns:
+            list: Crisp value per output variable, ordered like OUTPUT_VARIABLES
+        """
+        if self._shared_output_spec is not None:
+            return self._shared_output_spec.centroids(output_rows, 100)
+        
+        return [
+            spec.centroid(row, 100)
+            for spec, row in zip(self._output_specs, output_rows)
+        ]
+    
     def compute_action_probabilities(self, ai_character, opponent_character, 
                                      threat_level=0.5, last_player_move=None,
                                      pattern_strength=0.0, cooldown_ratio=1.0):
@@ -567,45 +1161,55 @@ class FuzzyLogicSystem:
             dict: Dictionary of action probabilities
         """
         
-        if last_player_move == 'special':
-            threat_level = min(1.0, threat_level + 0.3)
-        elif last_player_move == 'punch':
-            threat_level = min(1.0, threat_level + 0.1)
-        elif last_player_move == 'rest':
-            threat_level = max(0.0, threat_level - 0.2)
+        threat_level += _THREAT_DELTA.get(last_player_move, 0.0)
+        threat_level = 0.0 if threat_level < 0.0 else 1.0 if threat_level > 1.0 else threat_level
         
         
-        fuzzy_inputs = self.fuzzify_inputs(
+        crisp_values = self._crisp_inputs(
             ai_character, opponent_character, threat_level,
-            pattern_strength=pattern_strength,
-            cooldown_ratio=cooldown_ratio
+            pattern_strength, cooldown_ratio
         )
         
         
-        output_memberships = self.evaluate_rules(fuzzy_inputs)
-        
+        action_probs = self._compute_cached(*[_quantize(value) for value in crisp_values])
         
-        action_probs = self.defuzzify(output_memberships, method='centroid')
+        return dict(zip(OUTPUT_ACTIONS, action_probs))
+    
+    def clear_cache(self):
+        """Drop this instance's memoized action probabilities and stored membership rows."""
+        self._compute_cached.cache_clear()
+        self._last_crisp = [None] * len(INPUT_VARIABLES)
+        self._membership_rows = [()] * len(INPUT_VARIABLES)
+    
+    def _compute_probabilities(self, *crisp_values):
+        """
+        Run fuzzify -> rules -> defuzzify for quantized crisp inputs.
+        Memoized per instance as _compute_cached.
         
+        Args:
+            crisp_values: Quantized input values in INPUT_VARIABLES order
+            
+        Returns:
+            tuple: Normalized probabilities ordered like OUTPUT_ACTIONS
+        """
+        memberships = self._fuzzify_crisp(crisp_values)
+        output_rows = self._aggregate_rules(memberships)
+        action_probs = self.defuzzify_rows(output_rows)
         
-        total = sum(action_probs.values())
+        total = sum(action_probs)
         if total > 0:
-            for action in action_probs:
-                action_probs[action] = action_probs[action] / total
-        
-        return {
-            'punch': action_probs.get('punch_prob', 0.0),
-            'kick': action_probs.get('kick_prob', 0.0),
-            'special': action_probs.get('special_prob', 0.0),
-            'block': action_probs.get('block_prob', 0.0),
-            'evade': action_probs.get('evade_prob', 0.0),
-            'rest': action_probs.get('rest_prob', 0.0)
-        }
-
+            scale = 1.0 / total
+            return tuple([prob * scale for prob in action_probs])
+        
+        return tuple(action_probs)
 
 
 _fuzzy_system = None
 
+if config.EAGER_FUZZY_INIT:
+    _fuzzy_system = FuzzyLogicSystem()
+
+
 def get_fuzzy_system():
     """Get or create the global fuzzy logic system instance."""
     global _fuzzy_system
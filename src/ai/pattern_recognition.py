@@ -3,30 +3,170 @@ Pattern Recognition System for AI.
 Detects player move patterns and predicts future moves.
 """
 
-from collections import deque, Counter
+import functools
+from collections import deque
+from types import MappingProxyType
+
+
+MOVE_NAMES = ('punch', 'kick', 'special', 'block', 'evade', 'rest')
+MOVE_IDS = {move: move_id for move_id, move in enumerate(MOVE_NAMES)}
+UNKNOWN_MOVE_ID = len(MOVE_NAMES)
+
+
+def _move_id(move):
+    """Get the small-int id of a move; every unknown move shares UNKNOWN_MOVE_ID."""
+    return MOVE_IDS.get(move, UNKNOWN_MOVE_ID)
+
+
+COMMON_PATTERNS = MappingProxyType({
+    'aggressive': ('punch', 'punch', 'special'),
+    'defensive': ('block', 'evade', 'block'),
+    'stamina_conserving': ('punch', 'rest', 'punch'),
+    'special_spam': ('special', 'rest', 'special'),
+    'counter': ('block', 'punch', 'block')
+})
+
+
+def _build_pattern_automaton(sequences):
+    """
+    Build an Aho-Corasick automaton over move-id sequences.
+    
+    Args:
+        sequences: Iterable of move-id tuples to match
+        
+    Returns:
+        tuple: (transitions, outputs) where transitions[state] maps a move id
+            to the next state (unlisted moves go back to state 0) and
+            outputs[state] holds the lengths of the sequences ending there
+    """
+    goto = [{}]
+    outputs = [set()]
+    for sequence in sequences:
+        state = 0
+        for move_id in sequence:
+            if move_id not in goto[state]:
+                goto.append({})
+                outputs.append(set())
+                goto[state][move_id] = len(goto) - 1
+            state = goto[state][move_id]
+        outputs[state].add(len(sequence))
+    
+    
+    symbols = {move_id for edges in goto for move_id in edges}
+    transitions = [dict(goto[0])]
+    failure = [0] * len(goto)
+    queue = deque(goto[0].values())
+    transitions.extend({} for _ in range(len(goto) - 1))
+    while queue:
+        state = queue.popleft()
+        outputs[state] |= outputs[failure[state]]
+        for move_id in symbols:
+            next_state = goto[state].get(move_id)
+            if next_state is None:
+                next_state = transitions[failure[state]].get(move_id, 0)
+                if next_state:
+                    transitions[state][move_id] = next_state
+            else:
+                transitions[state][move_id] = next_state
+                failure[next_state] = transitions[failure[state]].get(move_id, 0)
+                queue.append(next_state)
+    
+    return tuple(transitions), tuple(tuple(sorted(lengths)) for lengths in outputs)
+
+
+def _pattern_automaton(patterns):
+    """
+    Build the matching automaton for a {name: move sequence} pattern table.
+    
+    Raises:
+        ValueError: If a pattern uses a move outside MOVE_NAMES
+    """
+    sequences = []
+    for name, sequence in patterns.items():
+        for move in sequence:
+            if move not in MOVE_IDS:
+                raise ValueError(f"Unknown move in pattern '{name}': {move}")
+        sequences.append(tuple(MOVE_IDS[move] for move in sequence))
+    return _build_pattern_automaton(sequences)
+
+
+_COMMON_PATTERN_AUTOMATON = _pattern_automaton(COMMON_PATTERNS)
+_PATTERN_LENGTH = 3
+
+
+_MAX_CACHED_FOLLOWERS = 32
+_PREDICTED_NAMES = MOVE_NAMES + (None,)
+
+
+@functools.lru_cache(maxsize=4096)
+def _predict(followers):
+    """
+    Predict the next move from the moves that followed the current pair.
+    
+    Args:
+        followers: Tuple of move ids that followed earlier occurrences of
+            the last two moves, oldest first
+        
+    Returns:
+        tuple: (pattern_strength, predicted move id or None)
+    """
+    if len(followers) < 2:
+        return 0.0, None
+    
+    
+    hits = 0
+    predicted_next_move = None
+    for move_id in followers:
+        count = followers.count(move_id)
+        if count > hits:
+            hits, predicted_next_move = count, move_id
+    
+    return min(1.0, hits / len(followers)), predicted_next_move
 
 
 class PatternRecognizer:
     """Recognizes and predicts player move patterns."""
     
-    def __init__(self, history_size=5):
+    _COUNTER_MAP = {
+        'punch': 'block',  
+        'special': 'evade',  
+        'block': 'special',  
+        'evade': 'punch',  
+    }
+    
+    def __init__(self, history_size=5, common_patterns=None):
         """
         Initialize pattern recognizer.
         
+        The patterns are compiled into a matching automaton here, so
+        common_patterns is exposed as a read-only mapping; pass a different
+        table to the constructor to detect other patterns.
+        
         Args:
             history_size: Number of recent moves to track
+            common_patterns: {name: move sequence} table, COMMON_PATTERNS by default
         """
         self.history_size = history_size
         self.move_history = deque(maxlen=history_size)
+        self._recent_moves = deque(maxlen=history_size)
         self.pattern_strength = 0.0  
         self.predicted_next_move = None
-        self.common_patterns = {
-            'aggressive': ['punch', 'punch', 'special'],
-            'defensive': ['block', 'evade', 'block'],
-            'stamina_conserving': ['punch', 'rest', 'punch'],
-            'special_spam': ['special', 'rest', 'special'],
-            'counter': ['block', 'punch', 'block']
-        }
+        if common_patterns is None:
+            self.common_patterns = COMMON_PATTERNS
+            self._pattern_transitions, self._pattern_outputs = _COMMON_PATTERN_AUTOMATON
+        else:
+            self.common_patterns = MappingProxyType({
+                name: tuple(sequence) for name, sequence in common_patterns.items()
+            })
+            self._pattern_transitions, self._pattern_outputs = _pattern_automaton(self.common_patterns)
+        
+        
+        self._pair_followers = {}
+        self._pattern_windows = 0
+        self._pattern_state = 0
+        self._pattern_starts = {}
+        self._moves_seen = 0
+        self._predicted_id = None
     
     def record_move(self, move):
         """
@@ -35,59 +175,74 @@ class PatternRecognizer:
         Args:
             move: Move type ('punch', 'block', etc.)
         """
-        self.move_history.append(move)
+        history = self.move_history
+        if len(history) == history.maxlen:
+            self._drop_windows(history)
+        
+        history.append(_move_id(move))
+        self._recent_moves.append(move)
+        self._add_windows(history)
         self._analyze_pattern()
     
-    def _analyze_pattern(self):
-        """Analyze move history for patterns."""
-        if len(self.move_history) < 2:
-            self.pattern_strength = 0.0
-            self.predicted_next_move = None
-            return
-        
+    def _add_windows(self, history):
+        """Count the windows and common patterns ending at the move just appended."""
+        size = len(history)
+        if size >= _PATTERN_LENGTH:
+            pair = (history[-3], history[-2])
+            followers = self._pair_followers.get(pair)
+            if followers is None:
+                followers = self._pair_followers[pair] = deque()
+            followers.append(history[-1])
         
-        move_list = list(self.move_history)
+        position = self._moves_seen
+        self._moves_seen += 1
+        if not size:
+            return
         
+        self._pattern_state = state = self._pattern_transitions[self._pattern_state].get(history[-1], 0)
+        for length in self._pattern_outputs[state]:
+            if length <= size:
+                start = position - length + 1
+                self._pattern_starts[start] = self._pattern_starts.get(start, 0) + 1
+                self._pattern_windows += 1
+    
+    def _drop_windows(self, history):
+        """Uncount the windows and common patterns starting at the move about to be evicted."""
+        size = len(history)
+        if size >= _PATTERN_LENGTH:
+            pair = (history[0], history[1])
+            followers = self._pair_followers[pair]
+            followers.popleft()
+            if not followers:
+                del self._pair_followers[pair]
         
-        if len(move_list) >= 3:
-            
-            last_two = tuple(move_list[-2:])
-            count = 0
-            for i in range(len(move_list) - 2):
-                if tuple(move_list[i:i+2]) == last_two:
-                    count += 1
-            
-            if count >= 2:
-                
-                self.pattern_strength = min(1.0, count / 3.0)
-                
-                
-                next_moves = []
-                for i in range(len(move_list) - 2):
-                    if tuple(move_list[i:i+2]) == last_two and i + 2 < len(move_list):
-                        next_moves.append(move_list[i + 2])
-                
-                if next_moves:
-                    most_common = Counter(next_moves).most_common(1)[0]
-                    self.predicted_next_move = most_common[0]
-                    self.pattern_strength = min(1.0, most_common[1] / len(next_moves))
-                else:
-                    self.predicted_next_move = None
-            else:
-                self.pattern_strength = 0.0
-                self.predicted_next_move = None
+        if self._pattern_starts:
+            self._pattern_windows -= self._pattern_starts.pop(self._moves_seen - size, 0)
+    
+    def _analyze_pattern(self):
+        """
+        Analyze move history for patterns.
         
+        Followers of each move pair and matches of common patterns are kept
+        up to date by record_move, so no pass over the history is needed.
+        """
+        history = self.move_history
+        if len(history) < 2:
+            self.pattern_strength, self.predicted_next_move = 0.0, None
+            self._predicted_id = None
+            return
         
-        history_str = ' -> '.join(move_list)
-        for pattern_name, pattern_sequence in self.common_patterns.items():
-            pattern_str = ' -> '.join(pattern_sequence)
-            if pattern_str in history_str:
-                self.pattern_strength = 0.8
-                
-                if len(move_list) < len(pattern_sequence):
-                    idx = len(move_list)
-                    if idx < len(pattern_sequence):
-                        self.predicted_next_move = pattern_sequence[idx]
+        followers = self._pair_followers.get((history[-2], history[-1]), ())
+        if len(followers) < 2:
+            self.pattern_strength, predicted_id = 0.0, None
+        elif len(followers) <= _MAX_CACHED_FOLLOWERS:
+            self.pattern_strength, predicted_id = _predict(tuple(followers))
+        else:
+            self.pattern_strength, predicted_id = _predict.__wrapped__(followers)
+        if self._pattern_windows:
+            self.pattern_strength = 0.8
+        self._predicted_id = predicted_id
+        self.predicted_next_move = _PREDICTED_NAMES[predicted_id] if predicted_id is not None else None
     
     def get_pattern_info(self):
         """
@@ -99,7 +254,7 @@ class PatternRecognizer:
         return {
             'pattern_strength': self.pattern_strength,
             'predicted_move': self.predicted_next_move,
-            'recent_moves': list(self.move_history)
+            'recent_moves': list(self._recent_moves)
         }
     
     def should_counter(self, move_type):
@@ -112,16 +267,8 @@ class PatternRecognizer:
         Returns:
             bool: True if counter is recommended
         """
-        if not self.predicted_next_move:
+        if self._predicted_id is None:
             return False
         
-        
-        counter_map = {
-            'punch': 'block',  
-            'special': 'evade',  
-            'block': 'special',  
-            'evade': 'punch',  
-        }
-        
-        return self.predicted_next_move == move_type and self.pattern_strength > 0.5
+        return MOVE_IDS.get(move_type) == self._predicted_id and self.pattern_strength > 0.5
 
@@ -0,0 +1,139 @@
+"""
+Numeric kernels for the batch arena.
+Fused per-fighter turn-start updates and batched attacks over flat stat
+columns.
+"""
+
+from src.utils import config
+
+
+def advance_fighters(hp, cooldown, turns_since_special, momentum, decays, decay,
+                     effect_columns, turn_flags):
+    """
+    Advance every fighter to the start of a new turn, in place.
+
+    Args:
+        hp, cooldown, turns_since_special, momentum: Stat columns, one entry
+            per fighter
+        decays: Per fighter, whether momentum decays this turn
+        decay: Momentum lost by decaying fighters
+        effect_columns: (damage, turns) column pairs, one per status effect
+            type, with None turns for fighters without the effect
+        turn_flags: Per-turn flag columns (block, evade, counter) cleared
+            for every fighter
+    """
+    for i in range(len(hp)):
+        h = hp[i]
+        for damage, turns in effect_columns:
+            t = turns[i]
+            if t is None:
+                continue
+
+            d = damage[i]
+            if d > 0:
+                h = h - d if h > d else 0
+            turns[i] = None if t <= 1 else t - 1
+        hp[i] = h
+
+        c = cooldown[i]
+        if c > 0:
+            cooldown[i] = c - 1
+        turns_since_special[i] += 1
+
+        if decays[i]:
+            m = momentum[i] - decay
+            momentum[i] = m if m > 0.0 else 0.0
+
+        for flags in turn_flags:
+            flags[i] = False
+
+
+def resolve_attacks(attackers, targets, move, cost, mult, fatigue, miss_base, miss_per,
+                    counter, fighters, roll, uniform, damage_out,
+                    _evade_chance=config.EVADE_SUCCESS_CHANCE,
+                    _evade_recov=config.EVADE_STAMINA_RECOVERY,
+                    _var_on=config.DAMAGE_VARIANCE_ENABLED,
+                    _var=config.DAMAGE_VARIANCE_PERCENT,
+                    _block_complete=config.BLOCK_COMPLETE_BLOCK_CHANCE,
+                    _block_factor=1.0 - config.BLOCK_DAMAGE_REDUCTION,
+                    _block_recov=config.BLOCK_STAMINA_RECOVERY,
+                    _crit_chance=config.CRITICAL_HIT_CHANCE,
+                    _crit_mult=config.CRITICAL_HIT_MULTIPLIER):
+    """
+    Resolve one punch or kick per (attacker, target) index pair, in place.
+
+    Follows the same stamina, evade, fatigue, momentum, miss, variance,
+    block, counter-attack and critical hit steps as the single-fight
+    attack, without building messages.
+
+    Args:
+        attackers, targets: Fighter indexes, one pair per attack
+        move: Move name recorded as the attacker's last move
+        cost, mult, fatigue, miss_base, miss_per, counter: Attack parameters
+        fighters: Stat columns as (stamina, max_stamina, hp, base_damage,
+            counter_damage, streak, other_streak, last_move, decays,
+            momentum, evade_bonus, evade_turns, is_blocking, is_evading,
+            can_counter)
+        roll: Callable returning a float in [0, 1)
+        uniform: Callable returning a float between its two arguments
+        damage_out: List that receives the damage dealt by each attack
+    """
+    (stamina, max_stamina, hp, base_damage, counter_damage, streak, other_streak,
+     last_move, decays, momentum, evade_bonus, evade_turns, is_blocking, is_evading,
+     can_counter) = fighters
+
+    for a, t in zip(attackers, targets):
+        if stamina[a] < cost:
+            damage_out.append(0)
+            continue
+
+        stamina[a] -= cost
+        s = streak[a] + 1 if last_move[a] == move else 1
+        streak[a] = s
+        other_streak[a] = 0
+        last_move[a] = move
+        decays[a] = True
+
+        evading = is_evading[t]
+        if evading and roll() < _evade_chance:
+            can_counter[t] = True
+            st = stamina[t] + _evade_recov
+            stamina[t] = st if st < max_stamina[t] else max_stamina[t]
+            damage_out.append(0)
+            continue
+
+        bonus = evade_bonus[a] if evade_turns[a] is not None else 0.0
+        multiplier = mult * (1.0 - s * fatigue) * (1.0 + momentum[a] + bonus)
+
+        miss_chance = miss_base + s * miss_per
+        if miss_chance > 0 and roll() < miss_chance:
+            damage_out.append(0)
+            continue
+
+        if _var_on:
+            multiplier *= uniform(1 - _var, 1 + _var)
+        damage = int(base_damage[a] * multiplier)
+
+        blocking = is_blocking[t]
+        if blocking:
+            damage = 0 if roll() < _block_complete else int(damage * _block_factor)
+        h = hp[t] - damage
+        hp[t] = h if h > 0 else 0
+
+        blocked = blocking and damage == 0
+        if blocked:
+            can_counter[t] = True
+            st = stamina[t] + _block_recov
+            stamina[t] = st if st < max_stamina[t] else max_stamina[t]
+
+        if (blocking or evading) and not blocked and roll() < counter:
+            h = hp[a] - counter_damage[t]
+            hp[a] = h if h > 0 else 0
+
+        if roll() < _crit_chance:
+            crit = int(damage * (_crit_mult - 1))
+            h = hp[t] - crit
+            hp[t] = h if h > 0 else 0
+            damage += crit
+
+        damage_out.append(damage)
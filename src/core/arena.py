@@ -0,0 +1,150 @@
+"""
+Batch arena for headless simulations.
+Holds the combat stats of many fighters as parallel columns so status
+effects, cooldowns, momentum and basic attacks advance in one pass over
+flat data.
+"""
+
+from src.core import _arena_kernels, rng
+from src.utils import config
+
+
+_DECAY_MOVES = frozenset(('punch', 'kick'))
+
+
+class BatchArena:
+    """
+    Structure-of-arrays view over the combat stats of many fighters.
+    
+    Each column holds one stat for every fighter, indexed like the fighters
+    list. Status effects get a damage column and a turns column per effect
+    type, with None marking fighters that do not have the effect. Block,
+    evade and counter flags are cleared by tick like reset_status does.
+    """
+    
+    def __init__(self, fighters):
+        """
+        Load fighters into the arena.
+        
+        Args:
+            fighters: Character objects, e.g. both fighters of many concurrent games
+        """
+        self.fighters = list(fighters)
+        self.load()
+    
+    def load(self):
+        """
+        Copy the fighters' current stats into the arena columns.
+        
+        Raises:
+            ValueError: If a fighter has a status effect with no known type
+        """
+        fighters = self.fighters
+        self.hp = [fighter.hp for fighter in fighters]
+        self.cooldown = [fighter.special_move_cooldown for fighter in fighters]
+        self.turns_since_special = [fighter.turns_since_special for fighter in fighters]
+        self.momentum = [fighter.move_variety_bonus for fighter in fighters]
+        self.decays = [fighter.last_move in _DECAY_MOVES for fighter in fighters]
+        self.stamina = [fighter.stamina for fighter in fighters]
+        self.max_stamina = [fighter.max_stamina for fighter in fighters]
+        self.base_damage = [fighter.base_damage for fighter in fighters]
+        self.counter_damage = [fighter.counter_damage for fighter in fighters]
+        self.consecutive_punches = [fighter.consecutive_punches for fighter in fighters]
+        self.consecutive_kicks = [fighter.consecutive_kicks for fighter in fighters]
+        self.last_move = [fighter.last_move for fighter in fighters]
+        self.is_blocking = [fighter.is_blocking for fighter in fighters]
+        self.is_evading = [fighter.is_evading for fighter in fighters]
+        self.can_counter_attack = [fighter.can_counter_attack for fighter in fighters]
+        
+        
+        self.effect_damage = {}
+        self.effect_turns = {}
+        for effect_type in config.STATUS_EFFECT_BITS:
+            effects = [fighter.status_effects.get(effect_type) for fighter in fighters]
+            self.effect_damage[effect_type] = [effect.get('damage', 0) if effect else 0 for effect in effects]
+            self.effect_turns[effect_type] = [effect['turns'] if effect else None for effect in effects]
+        self.evade_bonus = [
+            fighter.status_effects['evade_bonus'].get('bonus', 0.0) if 'evade_bonus' in fighter.status_effects else 0.0
+            for fighter in fighters
+        ]
+        
+        for fighter in fighters:
+            for effect_type in fighter.status_effects:
+                if effect_type not in config.STATUS_EFFECT_BITS:
+                    raise ValueError(f"Unsupported status effect: {effect_type}")
+    
+    def tick(self):
+        """
+        Advance every fighter to the start of a new turn.
+        
+        Applies status effect damage and expires finished effects, ticks
+        special move cooldowns, decays momentum after punches and kicks and
+        clears the block, evade and counter flags.
+        """
+        _arena_kernels.advance_fighters(
+            self.hp, self.cooldown, self.turns_since_special, self.momentum,
+            self.decays, config.MOMENTUM_DECAY,
+            [(self.effect_damage[effect_type], turns) for effect_type, turns in self.effect_turns.items()],
+            (self.is_blocking, self.is_evading, self.can_counter_attack)
+        )
+    
+    def punch(self, attackers, targets, roll=rng.roll, uniform=rng.uniform):
+        """
+        Resolve one punch for each (attacker, target) pair in a single pass.
+        
+        Applies the same rules as moves.punch to the arena columns, without
+        building messages.
+        
+        Args:
+            attackers: Fighter indexes of the punching fighters
+            targets: Fighter indexes of their targets, paired with attackers
+            roll: Random roll source, defaults to the configured combat rolls
+            uniform: Random uniform source for damage variance
+            
+        Returns:
+            list: Damage dealt by each punch, 0 when it failed, was evaded or missed
+        """
+        damage = []
+        _arena_kernels.resolve_attacks(
+            attackers, targets, 'punch', config.PUNCH_STAMINA_COST,
+            config.PUNCH_DAMAGE_MULTIPLIER, config.PUNCH_FATIGUE_PENALTY, 0.0,
+            config.PUNCH_MISS_CHANCE_PER_FATIGUE, config.PUNCH_COUNTER_RISK,
+            (self.stamina, self.max_stamina, self.hp, self.base_damage, self.counter_damage,
+             self.consecutive_punches, self.consecutive_kicks, self.last_move, self.decays,
+             self.momentum, self.evade_bonus, self.effect_turns['evade_bonus'],
+             self.is_blocking, self.is_evading, self.can_counter_attack),
+            roll, uniform, damage
+        )
+        return damage
+    
+    def store(self):
+        """Write the arena columns back to the fighters, removing expired effects."""
+        effect_columns = self.effect_turns.items()
+        for i, fighter in enumerate(self.fighters):
+            fighter.hp = self.hp[i]
+            fighter.special_move_cooldown = self.cooldown[i]
+            fighter.turns_since_special = self.turns_since_special[i]
+            fighter.move_variety_bonus = self.momentum[i]
+            fighter.stamina = self.stamina[i]
+            fighter.consecutive_punches = self.consecutive_punches[i]
+            fighter.consecutive_kicks = self.consecutive_kicks[i]
+            fighter.last_move = self.last_move[i]
+            fighter.is_blocking = self.is_blocking[i]
+            fighter.is_evading = self.is_evading[i]
+            fighter.can_counter_attack = self.can_counter_attack[i]
+            
+            status_effects = fighter.status_effects
+            if not status_effects:
+                continue
+            
+            for effect_type, turns in effect_columns:
+                if turns[i] is not None:
+                    status_effects[effect_type]['turns'] = turns[i]
+                elif effect_type in status_effects:
+                    del status_effects[effect_type]
+            
+            bits = 0
+            for effect_type in status_effects:
+                bits |= config.STATUS_EFFECT_BITS[effect_type]
+            fighter.status_effect_bits = bits
+            fighter.status_effect_names = ", ".join(status_effects)
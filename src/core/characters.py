@@ -1,6 +1,27 @@
+from src.core import rng
+from src.utils import config
+
+
+_random = rng.draw
+
+
+_BLOCK_COMPLETE_CHANCE = config.BLOCK_COMPLETE_BLOCK_CHANCE
+_BLOCK_DAMAGE_FACTOR = 1.0 - config.BLOCK_DAMAGE_REDUCTION
+_MOMENTUM_STEP = config.MOMENTUM_BONUS_PER_UNIQUE_MOVE
+_MOMENTUM_MAX = config.MOMENTUM_MAX_BONUS
+
 
 class Character:
 
+    __slots__ = (
+        'name', 'max_hp', 'hp', 'max_stamina', 'stamina', 'base_damage',
+        'special_move_name', 'is_blocking', 'is_evading', 'status_effects',
+        'status_effect_bits', 'status_effect_names', 'special_move_cooldown', 'turns_since_special',
+        'consecutive_punches', 'consecutive_kicks', 'last_move',
+        'move_variety_bonus', 'can_counter_attack', 'counter_damage',
+        '_msg_no_stamina', '_msg_cooldown'
+    )
+
     def __init__(self, name, max_hp, max_stamina, base_damage, special_move_name):
 
         self.name = name
@@ -9,10 +30,13 @@ class Character:
         self.max_stamina = max_stamina
         self.stamina = max_stamina
         self.base_damage = base_damage
+        self.counter_damage = int(base_damage * config.COUNTER_DAMAGE_SCALE)
         self.special_move_name = special_move_name
         self.is_blocking = False
         self.is_evading = False
         self.status_effects = {} 
+        self.status_effect_bits = 0
+        self.status_effect_names = ""
         self.special_move_cooldown = 0
         self.turns_since_special = 0
         self.consecutive_punches = 0
@@ -20,12 +44,22 @@ class Character:
         self.last_move = None
         self.move_variety_bonus = 0.0
         self.can_counter_attack = False
+        
+        
+        self._msg_no_stamina = f"{name} doesn't have enough stamina!"
+        self._msg_cooldown = f"{name}'s {special_move_name} is on cooldown! ({{}} turns remaining)"
     
     def reset_status(self):
         self.is_blocking = False
         self.is_evading = False
         self.can_counter_attack = False
     
+    def record_non_attack_move(self, move_name):
+        self.consecutive_punches = 0
+        self.consecutive_kicks = 0
+        self.last_move = move_name
+        self.move_variety_bonus = min(_MOMENTUM_MAX, self.move_variety_bonus + _MOMENTUM_STEP)
+    
     def can_use_special(self):
         return self.special_move_cooldown == 0
     
@@ -33,13 +67,12 @@ class Character:
         if not self.can_use_special():
             return {
                 'success': False,
-                'message': f"{self.name}'s {self.special_move_name} is on cooldown! ({self.special_move_cooldown} turns remaining)"
+                'message': self._msg_cooldown.format(self.special_move_cooldown)
             }
         
         result = self.use_special_move(target)
         
         if result.get('success', False):
-            from src.utils import config
             self.special_move_cooldown = config.SPECIAL_MOVE_COOLDOWN_TURNS
             self.turns_since_special = 0
         
@@ -56,42 +89,61 @@ class Character:
             'turns': turns,
             **kwargs
         }
+        self.status_effect_bits |= config.STATUS_EFFECT_BITS.get(effect_type, config.STATUS_EFFECT_OTHER_BIT)
+        self.status_effect_names = ", ".join(self.status_effects)
     
     def has_status_effect(self, effect_type):
         return effect_type in self.status_effects
     
     def process_status_effects(self):
+        status_effects = self.status_effects
+        if not status_effects:
+            return {
+                'damage': 0,
+                'expired_effects': [],
+                'active_effects': []
+            }
+        
         total_damage = 0
         expired_effects = []
         
-        for effect_type, effect_data in list(self.status_effects.items()):
-            if effect_data.get('damage', 0) > 0:
-                damage = effect_data['damage']
+        for effect_type, effect_data in status_effects.items():
+            damage = effect_data.get('damage', 0)
+            if damage > 0:
                 self.hp = max(0, self.hp - damage)
                 total_damage += damage
             
-            effect_data['turns'] -= 1
+            turns = effect_data['turns'] - 1
+            effect_data['turns'] = turns
             
-            if effect_data['turns'] <= 0:
+            if turns <= 0:
                 expired_effects.append(effect_type)
-                del self.status_effects[effect_type]
+        
+        if expired_effects:
+            for effect_type in expired_effects:
+                del status_effects[effect_type]
+            bits = 0
+            for effect_type in self.status_effects:
+                bits |= config.STATUS_EFFECT_BITS.get(effect_type, config.STATUS_EFFECT_OTHER_BIT)
+            self.status_effect_bits = bits
+            self.status_effect_names = ", ".join(status_effects)
         
         return {
             'damage': total_damage,
             'expired_effects': expired_effects,
-            'active_effects': list(self.status_effects.keys())
+            'active_effects': list(status_effects)
         }
     
     def _apply_damage_with_block_check(self, target, damage, move_name):
         was_blocking = target.is_blocking
         actual_damage = target.take_damage(damage)
         
-        if was_blocking and actual_damage == 0:
-            return (0, True, f"{self.name} uses {move_name}, but {target.name} completely blocks it!")
-        elif was_blocking and actual_damage < damage:
-            return (actual_damage, False, f"{self.name} uses {move_name}! {target.name} blocks, takes {actual_damage} damage (reduced from {damage})!")
-        else:
-            return (actual_damage, False, f"{self.name} uses {move_name}! Deals {actual_damage} damage!")
+        if was_blocking:
+            if actual_damage == 0:
+                return (0, True, f"{self.name} uses {move_name}, but {target.name} completely blocks it!")
+            if actual_damage < damage:
+                return (actual_damage, False, f"{self.name} uses {move_name}! {target.name} blocks, takes {actual_damage} damage (reduced from {damage})!")
+        return (actual_damage, False, f"{self.name} uses {move_name}! Deals {actual_damage} damage!")
     
     def use_special_move(self, target):
         raise NotImplementedError("Each character must implement use_special_move")
@@ -104,14 +156,9 @@ class Character:
     
     def take_damage(self, damage):
         if self.is_blocking:
-            import random
-            from src.utils import config
-            
-            if random.random() < config.BLOCK_COMPLETE_BLOCK_CHANCE:
-                return 0  
-            
-            damage = int(damage * (1.0 - config.BLOCK_DAMAGE_REDUCTION))
-        self.hp = max(0, self.hp - damage)
+            damage = 0 if _random() < _BLOCK_COMPLETE_CHANCE else int(damage * _BLOCK_DAMAGE_FACTOR)
+        hp = self.hp - damage
+        self.hp = hp if hp > 0 else 0
         return damage
     
     def is_alive(self):
@@ -130,6 +177,8 @@ class Character:
 
 class Warrior(Character):
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__(
             name="Warrior",
@@ -142,7 +191,7 @@ class Warrior(Character):
     def use_special_move(self, target):
         stamina_cost = 30
         if self.stamina < stamina_cost:
-            return {'success': False, 'message': f"{self.name} doesn't have enough stamina!"}
+            return {'success': False, 'message': self._msg_no_stamina}
         
         self.stamina -= stamina_cost
         damage = int(self.base_damage * 2.5)
@@ -162,6 +211,8 @@ class Warrior(Character):
 
 class Tank(Character):
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__(
             name="Tank",
@@ -174,7 +225,7 @@ class Tank(Character):
     def use_special_move(self, target):
         stamina_cost = 35
         if self.stamina < stamina_cost:
-            return {'success': False, 'message': f"{self.name} doesn't have enough stamina!"}
+            return {'success': False, 'message': self._msg_no_stamina}
         
         self.stamina -= stamina_cost
         self.is_blocking = True  
@@ -197,6 +248,8 @@ class Tank(Character):
 class Assassin(Character):
     """High crit chance, ignores block."""
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__(
             name="Assassin",
@@ -210,15 +263,14 @@ class Assassin(Character):
         """Shadow Strike: High crit chance, ignores block."""
         stamina_cost = 30
         if self.stamina < stamina_cost:
-            return {'success': False, 'message': f"{self.name} doesn't have enough stamina!"}
+            return {'success': False, 'message': self._msg_no_stamina}
         
         self.stamina -= stamina_cost
         
         if target.is_evading:
             return {'success': False, 'message': f"{target.name} evaded the attack!", 'stamina_cost': stamina_cost}
         
-        import random
-        is_crit = random.random() < 0.6
+        is_crit = _random() < 0.6
         base_damage = int(self.base_damage * 2.0)
         
         if is_crit:
@@ -243,6 +295,8 @@ class Assassin(Character):
 
 class Mage(Character):
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__(
             name="Mage",
@@ -255,7 +309,7 @@ class Mage(Character):
     def use_special_move(self, target):
         stamina_cost = 35
         if self.stamina < stamina_cost:
-            return {'success': False, 'message': f"{self.name} doesn't have enough stamina!"}
+            return {'success': False, 'message': self._msg_no_stamina}
         
         self.stamina -= stamina_cost
         
@@ -288,6 +342,8 @@ class Mage(Character):
 
 class Samurai(Character):
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__(
             name="Samurai",
@@ -300,14 +356,13 @@ class Samurai(Character):
     def use_special_move(self, target):
         stamina_cost = 28
         if self.stamina < stamina_cost:
-            return {'success': False, 'message': f"{self.name} doesn't have enough stamina!"}
+            return {'success': False, 'message': self._msg_no_stamina}
         
         self.stamina -= stamina_cost
 
-        import random
         hit_chance = 0.9
         
-        if target.is_evading and random.random() > hit_chance:
+        if target.is_evading and _random() > hit_chance:
             return {'success': False, 'message': f"{target.name} evaded the attack!", 'stamina_cost': stamina_cost}
         
         damage = int(self.base_damage * 2.3)
@@ -331,10 +386,17 @@ CHARACTERS = {
 }
 
 
+_CHARACTER_LOOKUP = {
+    spelling: cls
+    for key, cls in CHARACTERS.items()
+    for spelling in (key, key.capitalize(), key.upper())
+}
+
+
 def get_character(name):
-    name_lower = name.lower()
-    if name_lower in CHARACTERS:
-        return CHARACTERS[name_lower]()
+    cls = _CHARACTER_LOOKUP.get(name) or CHARACTERS.get(name.lower())
+    if cls is not None:
+        return cls()
     return None
 
 
@@ -6,13 +6,48 @@ Handles game loop, turn resolution, HP/stamina updates, and win/loss conditions.
 from src.core import characters, moves
 from src.ai import ai
 from src.utils import utils, config
+import random
+import sys
 import time
+import traceback
+
+
+_SEPARATOR = "=" * 70
+_DIVIDER = "-" * 70
+_GAME_OVER_BANNER = "\n".join(["\n" + _SEPARATOR, " " * 30 + "GAME OVER!", _SEPARATOR])
+_FINAL_STATUS_HEADER = "\n".join(["\n" + _SEPARATOR, "Final Status:", _DIVIDER])
+
+
+_DECAY_MOVES = frozenset(('punch', 'kick'))
+
+
+_CHARACTER_NAMES = tuple(characters.list_all_characters())
+_CHARACTER_INDEX = {name: i for i, name in enumerate(_CHARACTER_NAMES)}
+
+
+def _discard_output(*args, **kwargs):
+    """Stand-in for print used by quiet engines."""
+
+
+_MENU_RULE = "─" * 70
+_CHARACTER_ROW_FMT = "{0:<4} {1:<18} {2:<22} {3:<6} {4:<6} {5:<4}"
+_CHARACTER_HEADER = _CHARACTER_ROW_FMT.format('#', 'Character', 'Special Move', 'HP', 'Stam', 'Dmg')
+_DIFFICULTY_ROW_FMT = "{0:<4} {1:<20} {2}"
+_DIFFICULTY_TABLE = "\n".join([
+    "\n" + _MENU_RULE,
+    "{0:<4} {1:<20} {2:<45}".format('#', 'Difficulty', 'Description'),
+    _MENU_RULE,
+    _DIFFICULTY_ROW_FMT.format('1', 'Easy', 'AI is more defensive, makes suboptimal moves'),
+    _DIFFICULTY_ROW_FMT.format('2', 'Medium', 'Balanced AI behavior (default)'),
+    _DIFFICULTY_ROW_FMT.format('3', 'Hard', 'AI is more aggressive and strategic'),
+    _MENU_RULE
+])
 
 
 class GameEngine:
     """Main game engine that manages the game loop and turn resolution."""
     
-    def __init__(self, player_character, ai_character, difficulty='medium'):
+    def __init__(self, player_character, ai_character, difficulty='medium', quiet=False):
         """
         Initialize the game engine.
         
@@ -20,6 +55,7 @@ class GameEngine:
             player_character: Player's character object
             ai_character: AI's character object
             difficulty: Difficulty level ('easy', 'medium', 'hard')
+            quiet: Suppress all battle output and pauses, for batch simulations
         """
         self.player = player_character
         self.ai_char = ai_character
@@ -30,59 +66,97 @@ class GameEngine:
         self.game_over = False
         self.winner = None
         
+        self.quiet = quiet
+        self._print = _discard_output if quiet else print
+        
+        
+        if config.PLAYER_TURN_FIRST:
+            self._turn_order = (self.player_turn, self.ai_turn)
+        else:
+            self._turn_order = (self.ai_turn, self.player_turn)
+        
+    def pause(self, seconds):
+        """
+        Pause between battle messages so a player can follow along.
+        
+        Skipped for quiet engines, when config.HEADLESS is set or when
+        stdout is not a terminal.
+        
+        Args:
+            seconds: Time to pause for
+        """
+        if self.quiet or config.HEADLESS or not sys.stdout.isatty():
+            return
+        time.sleep(seconds)
+    
     def start_game(self):
         """Start the game and display initial state."""
-        print("\n" + "=" * 70)
-        print(" " * 25 + "BATTLE BEGINS!")
-        print("=" * 70)
-        time.sleep(1.0)
+        self._print("\n" + _SEPARATOR)
+        self._print(" " * 25 + "BATTLE BEGINS!")
+        self._print(_SEPARATOR)
+        self.pause(1.0)
         
-    def display_battle_status_with_moves(self):
-        """Display battle status and move selection in one simple block."""
-        print("\n" + "=" * 70)
-        print(f"TURN {self.turn_number}")
-        print("=" * 70)
+    def display_battle_status_with_moves(self, available_moves=None):
+        """
+        Display battle status and move selection in one simple block.
+        
+        Args:
+            available_moves: Player's available moves, if already looked up
+            
+        Returns:
+            dict: Each option number and lowercased move name mapped to its move
+        """
+        if available_moves is None:
+            available_moves = moves.get_available_moves(self.player)
+        move_lookup = {str(i): move for i, move in enumerate(available_moves, 1)}
+        move_lookup.update((move.lower(), move) for move in available_moves)
+        if self.quiet:
+            return move_lookup
+        
+        lines = [
+            "\n" + _SEPARATOR,
+            f"TURN {self.turn_number}",
+            _SEPARATOR
+        ]
         
         
         player_hp_bar = utils.create_bar(self.player.hp, self.player.max_hp, 30)
         player_stam_bar = utils.create_bar(self.player.stamina, self.player.max_stamina, 25)
-        print(f"\n{self.player.name.upper()}")
-        print(f"  HP:  [{player_hp_bar}] {self.player.hp}/{self.player.max_hp}")
-        print(f"  ST:  [{player_stam_bar}] {self.player.stamina}/{self.player.max_stamina}")
+        lines.append(f"\n{self.player.name.upper()}")
+        lines.append(f"  HP:  [{player_hp_bar}] {self.player.hp}/{self.player.max_hp}")
+        lines.append(f"  ST:  [{player_stam_bar}] {self.player.stamina}/{self.player.max_stamina}")
         
         
         player_effects = utils.format_status_effects(self.player)
         if player_effects != "None":
-            print(f"  Effects: {player_effects}")
+            lines.append(f"  Effects: {player_effects}")
         if self.player.special_move_cooldown > 0:
-            print(f"  Special Cooldown: {self.player.special_move_cooldown} turns")
+            lines.append(f"  Special Cooldown: {self.player.special_move_cooldown} turns")
         
         
         ai_hp_bar = utils.create_bar(self.ai_char.hp, self.ai_char.max_hp, 30)
         ai_stam_bar = utils.create_bar(self.ai_char.stamina, self.ai_char.max_stamina, 25)
-        print(f"\n{self.ai_char.name.upper()}")
-        print(f"  HP:  [{ai_hp_bar}] {self.ai_char.hp}/{self.ai_char.max_hp}")
-        print(f"  ST:  [{ai_stam_bar}] {self.ai_char.stamina}/{self.ai_char.max_stamina}")
+        lines.append(f"\n{self.ai_char.name.upper()}")
+        lines.append(f"  HP:  [{ai_hp_bar}] {self.ai_char.hp}/{self.ai_char.max_hp}")
+        lines.append(f"  ST:  [{ai_stam_bar}] {self.ai_char.stamina}/{self.ai_char.max_stamina}")
         
         
         ai_effects = utils.format_status_effects(self.ai_char)
         if ai_effects != "None":
-            print(f"  Effects: {ai_effects}")
+            lines.append(f"  Effects: {ai_effects}")
         if self.ai_char.special_move_cooldown > 0:
-            print(f"  Special Cooldown: {self.ai_char.special_move_cooldown} turns")
+            lines.append(f"  Special Cooldown: {self.ai_char.special_move_cooldown} turns")
         
         
         if config.SHOW_AI_DECISIONS:
             state_info = self.ai_controller.get_state_info()
-            print(f"  AI State: {state_info['state']}")
+            lines.append(f"  AI State: {state_info['state']}")
         
-        print("\n" + "-" * 70)
-        print("YOUR MOVES:")
-        print("-" * 70)
+        lines.append("\n" + _DIVIDER)
+        lines.append("YOUR MOVES:")
+        lines.append(_DIVIDER)
         
         
-        available_moves = moves.get_available_moves(self.player)
-        move_options = []
         for i, move in enumerate(available_moves, 1):
             move_info = moves.get_move_info(move)
             can_perform, reason = moves.can_perform_move(self.player, move)
@@ -102,33 +176,19 @@ class GameEngine:
                 move_name = move_info['name']
                 status = "[Available]" if can_perform else f"[{reason}]"
             
-            print(f"  {i}. {move_name} {status}")
-            move_options.append((str(i), move))
+            lines.append(f"  {i}. {move_name} {status}")
         
-        print("-" * 70)
+        lines.append(_DIVIDER)
+        sys.stdout.write("\n".join(lines) + "\n")
+        return move_lookup
     
     def process_status_effects(self):
         """Process status effects for both characters at the start of turn."""
         status_messages = []
+        for char in (self.player, self.ai_char):
+            status_messages.extend(self._status_effect_messages(char, char.process_status_effects()))
         
-        
-        player_effects = self.player.process_status_effects()
-        if player_effects['damage'] > 0:
-            status_messages.append(f"{self.player.name} takes {player_effects['damage']} damage from status effects!")
-            if player_effects['expired_effects']:
-                status_messages.append(f"  {self.player.name}'s effects expired: {', '.join(player_effects['expired_effects'])}")
-        
-        
-        ai_effects = self.ai_char.process_status_effects()
-        if ai_effects['damage'] > 0:
-            status_messages.append(f"{self.ai_char.name} takes {ai_effects['damage']} damage from status effects!")
-            if ai_effects['expired_effects']:
-                status_messages.append(f"  {self.ai_char.name}'s effects expired: {', '.join(ai_effects['expired_effects'])}")
-        
-        if status_messages:
-            for msg in status_messages:
-                print(msg)
-                time.sleep(0.5)
+        self.display_status_messages(status_messages)
         
         
         if not self.player.is_alive():
@@ -138,16 +198,65 @@ class GameEngine:
             self.game_over = True
             self.winner = self.player
     
-    def reset_turn_status(self):
-        """Reset status effects (block/evade) for both characters."""
+    def _status_effect_messages(self, char, effects):
+        """
+        Build the messages describing a character's status effect damage.
+        
+        Args:
+            char: Character the effects were processed for
+            effects: Result of char.process_status_effects()
+            
+        Returns:
+            list: Messages to display
+        """
+        if effects['damage'] <= 0:
+            return []
+        
+        messages = [f"{char.name} takes {effects['damage']} damage from status effects!"]
+        if effects['expired_effects']:
+            messages.append(f"  {char.name}'s effects expired: {', '.join(effects['expired_effects'])}")
+        return messages
+    
+    def display_status_messages(self, status_messages):
+        """
+        Print status effect messages in one write, then pause once.
         
-        if self.player.last_move and self.player.last_move in ['punch', 'kick']:
-            self.player.move_variety_bonus = max(0.0, self.player.move_variety_bonus - config.MOMENTUM_DECAY)
-        if self.ai_char.last_move and self.ai_char.last_move in ['punch', 'kick']:
-            self.ai_char.move_variety_bonus = max(0.0, self.ai_char.move_variety_bonus - config.MOMENTUM_DECAY)
+        Args:
+            status_messages: Messages to print
+        """
+        if not status_messages or self.quiet:
+            return
+        
+        sys.stdout.write("\n".join(status_messages) + "\n")
+        sys.stdout.flush()
+        self.pause(0.5)
+    
+    def _advance_character(self, char):
+        """
+        Bring a character to the start of a new turn in a single pass.
         
-        self.player.reset_status()
-        self.ai_char.reset_status()
+        Processes status effects, ticks cooldowns, decays momentum and
+        resets block/evade status.
+        
+        Args:
+            char: Character to advance
+            
+        Returns:
+            list: Status effect messages to display
+        """
+        messages = self._status_effect_messages(char, char.process_status_effects())
+        char.tick_cooldowns()
+        if char.last_move in _DECAY_MOVES:
+            char.move_variety_bonus = max(0.0, char.move_variety_bonus - config.MOMENTUM_DECAY)
+        char.reset_status()
+        return messages
+    
+    def reset_turn_status(self):
+        """Reset status effects (block/evade) for both characters."""
+        for char in (self.player, self.ai_char):
+            if char.last_move in _DECAY_MOVES:
+                char.move_variety_bonus = max(0.0, char.move_variety_bonus - config.MOMENTUM_DECAY)
+            char.reset_status()
     
     def tick_cooldowns(self):
         """Decrease cooldowns for both characters each turn."""
@@ -157,30 +266,17 @@ class GameEngine:
     def player_turn(self):
         """Handle player's turn."""
         
-        self.display_battle_status_with_moves()
+        move_lookup = self.display_battle_status_with_moves()
         
         
-        available_moves = moves.get_available_moves(self.player)
-        move_options = []
-        for i, move in enumerate(available_moves, 1):
-            move_options.append((str(i), move))
-        
-        valid_inputs = [opt[0] for opt in move_options] + [opt[1] for opt in move_options]
         choice = utils.get_user_input(
             f"\nYour move: ",
-            valid_options=valid_inputs,
+            valid_options=move_lookup,
             case_sensitive=False
         )
         
         
-        player_move = None
-        for num, move in move_options:
-            if choice == num or choice.lower() == move.lower():
-                player_move = move
-                break
-        
-        if player_move is None:
-            player_move = choice.lower()
+        player_move = move_lookup.get(choice.lower(), choice.lower())
         
         
         ai_hp_before = self.ai_char.hp
@@ -194,22 +290,17 @@ class GameEngine:
             self.ai_controller.record_damage_taken(damage_to_ai)
         
         
-        print(f"\n{self.player.name}: {result.get('message', '')}")
-        time.sleep(1.0)
+        self._print(f"\n{self.player.name}: {result.get('message', '')}")
+        self.pause(1.0)
         
         
         
-        if player_move == 'special':
-            self.ai_controller.record_player_move('special')
-        elif player_move in ['punch', 'kick']:
-            self.ai_controller.record_player_move(player_move)  
-        else:
-            self.ai_controller.record_player_move(player_move)
+        self.ai_controller.record_player_move(player_move)
         
         
         if not self.ai_char.is_alive():
             self.game_over = True
-            self.winner = self.player
+            self.winner = self.player if self.player.is_alive() else self.ai_char
             return
         
         return result
@@ -220,8 +311,8 @@ class GameEngine:
         result = self.ai_controller.make_move(self.player)
         
         
-        print(f"{self.ai_char.name}: {result.get('message', '')}")
-        time.sleep(1.0)
+        self._print(f"{self.ai_char.name}: {result.get('message', '')}")
+        self.pause(1.0)
         
         
         if not self.player.is_alive():
@@ -236,42 +327,34 @@ class GameEngine:
         self.turn_number += 1
         
         
-        
-        self.process_status_effects()
-        if self.game_over:
+        status_messages = []
+        for char in (self.player, self.ai_char):
+            status_messages.extend(self._advance_character(char))
+        self.display_status_messages(status_messages)
+        if self.check_game_over():
             return
         
         
-        self.tick_cooldowns()
-        
-        
-        self.reset_turn_status()
-        
-        
-        if config.PLAYER_TURN_FIRST:
-            self.player_turn()
+        for half_turn in self._turn_order:
+            half_turn()
             if self.game_over:
                 return
-            
-            self.ai_turn()
-        else:
-            self.ai_turn()
-            if self.game_over:
-                return
-            
-            self.player_turn()
         
-        
-        if not self.game_over:
-            time.sleep(0.5)
+        self.pause(0.5)
     
     def check_game_over(self):
         """
         Check if game is over.
         
+        The turn methods set the flag when they knock a fighter out, so
+        fighters are only checked when it is not already set.
+        
         Returns:
             bool: True if game is over
         """
+        if self.game_over:
+            return True
+        
         if not self.player.is_alive():
             self.game_over = True
             self.winner = self.ai_char
@@ -286,41 +369,33 @@ class GameEngine:
     
     def display_winner(self):
         """Display the winner and game statistics."""
-        if self.winner is None:
+        if self.winner is None or self.quiet:
             return
         
-        player_won = (self.winner == self.player)
-        
-        print("\n" + "=" * 70)
-        print(" " * 30 + "GAME OVER!")
-        print("=" * 70)
-        print(f"\n{self.winner.name.upper()} WINS!")
-        print(f"\nTotal Turns: {self.turn_number}")
-        print(f"Difficulty: {self.difficulty.upper()}")
-        
-        print("\n" + "=" * 70)
-        print("Final Status:")
-        print("-" * 70)
-        print(f"{self.player.name}: {self.player.hp}/{self.player.max_hp} HP, {self.player.stamina}/{self.player.max_stamina} ST")
-        print(f"{self.ai_char.name}: {self.ai_char.hp}/{self.ai_char.max_hp} HP, {self.ai_char.stamina}/{self.ai_char.max_stamina} ST")
-        print("=" * 70)
+        lines = [
+            _GAME_OVER_BANNER,
+            f"\n{self.winner.name.upper()} WINS!",
+            f"\nTotal Turns: {self.turn_number}",
+            f"Difficulty: {self.difficulty.upper()}",
+            _FINAL_STATUS_HEADER,
+            f"{self.player.name}: {self.player.hp}/{self.player.max_hp} HP, {self.player.stamina}/{self.player.max_stamina} ST",
+            f"{self.ai_char.name}: {self.ai_char.hp}/{self.ai_char.max_hp} HP, {self.ai_char.stamina}/{self.ai_char.max_stamina} ST",
+            _SEPARATOR
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def run_game(self):
         """Run the main game loop."""
         self.start_game()
         
-        while not self.game_over:
+        while not self.check_game_over():
             self.execute_turn()
-            
-            
-            if self.check_game_over():
-                break
         
         self.display_winner()
         return self.winner
 
 
-def create_game(player_character_name, ai_character_name=None, difficulty='medium'):
+def create_game(player_character_name, ai_character_name=None, difficulty='medium', quiet=False):
     """
     Create a new game instance.
     
@@ -328,6 +403,7 @@ def create_game(player_character_name, ai_character_name=None, difficulty='mediu
         player_character_name: Name of player's character
         ai_character_name: Name of AI's character (None for random)
         difficulty: Difficulty level ('easy', 'medium', 'hard')
+        quiet: Suppress all battle output and pauses
         
     Returns:
         GameEngine instance
@@ -339,17 +415,21 @@ def create_game(player_character_name, ai_character_name=None, difficulty='mediu
     
     
     if ai_character_name is None:
-        import random
-        available_chars = characters.list_all_characters()
-        
-        available_chars = [c for c in available_chars if c != player_character_name.lower()]
-        ai_character_name = random.choice(available_chars)
+        player_index = _CHARACTER_INDEX.get(player_character_name.lower())
+        if player_index is None:
+            ai_character_name = random.choice(_CHARACTER_NAMES)
+        else:
+            
+            ai_index = random.randrange(len(_CHARACTER_NAMES) - 1)
+            if ai_index >= player_index:
+                ai_index += 1
+            ai_character_name = _CHARACTER_NAMES[ai_index]
     
     ai_char = characters.get_character(ai_character_name)
     if ai_char is None:
         raise ValueError(f"Invalid AI character: {ai_character_name}")
     
-    return GameEngine(player_char, ai_char, difficulty)
+    return GameEngine(player_char, ai_char, difficulty, quiet=quiet)
 
 
 def display_character_selection():
@@ -363,18 +443,19 @@ def display_character_selection():
     print("║" + " " * 20 + "CHARACTER SELECTION" + " " * 29 + "║")
     print("╚" + "═" * 68 + "╝")
     
-    char_list = characters.list_all_characters()
+    char_list = _CHARACTER_NAMES
+    roster = {char_name: characters.get_character(char_name) for char_name in char_list}
     
-    print(f"\n{'─' * 70}")
-    print(f"{'#':<4} {'Character':<18} {'Special Move':<22} {'HP':<6} {'Stam':<6} {'Dmg':<4}")
-    print(f"{'─' * 70}")
+    print("\n" + _MENU_RULE)
+    print(_CHARACTER_HEADER)
+    print(_MENU_RULE)
     
     for i, char_name in enumerate(char_list, 1):
-        char = characters.get_character(char_name)
+        char = roster[char_name]
         if char:
-            print(f"{i:<4} {char.name:<18} {char.special_move_name:<22} {char.max_hp:<6} {char.max_stamina:<6} {char.base_damage:<4}")
+            print(_CHARACTER_ROW_FMT.format(i, char.name, char.special_move_name, char.max_hp, char.max_stamina, char.base_damage))
     
-    print(f"{'─' * 70}")
+    print(_MENU_RULE)
     
     while True:
         try:
@@ -384,7 +465,7 @@ def display_character_selection():
             if choice.isdigit():
                 choice_num = int(choice)
                 if 1 <= choice_num <= len(char_list):
-                    selected_char = characters.get_character(char_list[choice_num - 1])
+                    selected_char = roster[char_list[choice_num - 1]]
                     print(f"\n  ✅ You selected: {selected_char.name}")
                     print(f"     Special Move: {selected_char.special_move_name}")
                     return char_list[choice_num - 1]
@@ -394,8 +475,8 @@ def display_character_selection():
             
             
             choice_lower = choice.lower()
-            if choice_lower in char_list:
-                selected_char = characters.get_character(choice_lower)
+            if choice_lower in roster:
+                selected_char = roster[choice_lower]
                 print(f"\n  ✅ You selected: {selected_char.name}")
                 print(f"     Special Move: {selected_char.special_move_name}")
                 return choice_lower
@@ -417,13 +498,7 @@ def display_difficulty_selection():
     print("║" + " " * 22 + "DIFFICULTY SELECTION" + " " * 27 + "║")
     print("╚" + "═" * 68 + "╝")
     
-    print(f"\n{'─' * 70}")
-    print(f"{'#':<4} {'Difficulty':<20} {'Description':<45}")
-    print(f"{'─' * 70}")
-    print(f"{'1':<4} {'Easy':<20} {'AI is more defensive, makes suboptimal moves'}")
-    print(f"{'2':<4} {'Medium':<20} {'Balanced AI behavior (default)'}")
-    print(f"{'3':<4} {'Hard':<20} {'AI is more aggressive and strategic'}")
-    print(f"{'─' * 70}")
+    print(_DIFFICULTY_TABLE)
     
     
     while True:
@@ -486,6 +561,5 @@ def main_game_loop():
     except Exception as e:
         print(f"\nAn error occurred: {e}")
         if config.DEBUG_MODE:
-            import traceback
             traceback.print_exc()
 
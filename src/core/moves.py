@@ -4,95 +4,139 @@ Implements the basic moves: Punch, Block, and Evade.
 Special moves are handled in each character's class.
 """
 
-import random
+import bisect
+from collections import namedtuple
+from types import MappingProxyType
+from src.core import rng
 from src.utils import config
 
 
-def punch(attacker, target):
+_EVADE_BONUS_BIT = config.STATUS_EFFECT_BITS['evade_bonus']
+_VALID_MOVES = config.VALID_MOVES
+
+
+AttackParams = namedtuple('AttackParams', [
+    'move', 'verb', 'streak_attr', 'reset_attr', 'stamina_cost', 'mult',
+    'fatigue', 'miss_base', 'miss_per', 'counter', 'miss_message'
+])
+
+
+_PUNCH_PARAMS = AttackParams(
+    move='punch',
+    verb='punches',
+    streak_attr='consecutive_punches',
+    reset_attr='consecutive_kicks',
+    stamina_cost=config.PUNCH_STAMINA_COST,
+    mult=config.PUNCH_DAMAGE_MULTIPLIER,
+    fatigue=config.PUNCH_FATIGUE_PENALTY,
+    miss_base=0.0,
+    miss_per=config.PUNCH_MISS_CHANCE_PER_FATIGUE,
+    counter=config.PUNCH_COUNTER_RISK,
+    miss_message="{} punches but misses due to fatigue! ({}% miss chance)"
+)
+
+
+_KICK_PARAMS = AttackParams(
+    move='kick',
+    verb='kicks',
+    streak_attr='consecutive_kicks',
+    reset_attr='consecutive_punches',
+    stamina_cost=config.KICK_STAMINA_COST,
+    mult=config.KICK_DAMAGE_MULTIPLIER,
+    fatigue=config.KICK_FATIGUE_PENALTY,
+    miss_base=config.KICK_BASE_MISS_CHANCE,
+    miss_per=config.KICK_MISS_CHANCE_PER_FATIGUE,
+    counter=config.KICK_COUNTER_RISK,
+    miss_message="{} kicks but misses! ({}% miss chance)"
+)
+
+
+def _execute_attack(attacker, target, params,
+                    _evade_chance=config.EVADE_SUCCESS_CHANCE,
+                    _evade_recov=config.EVADE_STAMINA_RECOVERY,
+                    _var_on=config.DAMAGE_VARIANCE_ENABLED,
+                    _var=config.DAMAGE_VARIANCE_PERCENT,
+                    _block_recov=config.BLOCK_STAMINA_RECOVERY,
+                    _crit_chance=config.CRITICAL_HIT_CHANCE,
+                    _crit_mult=config.CRITICAL_HIT_MULTIPLIER,
+                    _random=rng.roll, _uniform=rng.uniform):
     """
-    Execute a punch attack.
-    Now includes fatigue penalty and counter-attack risk.
+    Execute a punch or kick.
+    Shared pipeline: stamina, evade, fatigue, momentum, miss, variance,
+    block, counter-attack and critical hit.
     
     Args:
-        attacker: Character performing the punch
+        attacker: Character performing the attack
         target: Character being attacked
+        params: AttackParams for the attack
         
     Returns:
-        dict: Result of the punch with damage, message, etc.
+        dict: Result of the attack with damage, message, etc.
     """
-    
-    if attacker.stamina < config.PUNCH_STAMINA_COST:
+    move = params.move
+    cost = params.stamina_cost
+    if attacker.stamina < cost:
         return {
             'success': False,
-            'message': f"{attacker.name} doesn't have enough stamina to punch!",
+            'message': f"{attacker.name} doesn't have enough stamina to {move}!",
             'stamina_cost': 0
         }
     
     
-    attacker.stamina -= config.PUNCH_STAMINA_COST
+    attacker.stamina -= cost
     
     
-    if attacker.last_move == 'punch':
-        attacker.consecutive_punches += 1
-    else:
-        attacker.consecutive_punches = 1  
-    attacker.consecutive_kicks = 0  
+    streak = getattr(attacker, params.streak_attr) + 1 if attacker.last_move == move else 1
+    setattr(attacker, params.streak_attr, streak)
+    setattr(attacker, params.reset_attr, 0)
     
-    attacker.last_move = 'punch'
+    attacker.last_move = move
     
     
     was_evading = target.is_evading
     evade_success = False
     if was_evading:
-        evade_success = random.random() < config.EVADE_SUCCESS_CHANCE
+        evade_success = _random() < _evade_chance
         if evade_success:
             
             target.can_counter_attack = True
             
-            target.restore_stamina(config.EVADE_STAMINA_RECOVERY)
+            target.restore_stamina(_evade_recov)
             return {
                 'success': False,
-                'message': f"{target.name} evaded {attacker.name}'s punch! (+{config.EVADE_STAMINA_RECOVERY} stamina)",
-                'stamina_cost': config.PUNCH_STAMINA_COST,
+                'message': f"{target.name} evaded {attacker.name}'s {move}! (+{_evade_recov} stamina)",
+                'stamina_cost': cost,
                 'evaded': True,
                 'counter_opportunity': True
             }
     
     
-    base_damage = int(attacker.base_damage * config.PUNCH_DAMAGE_MULTIPLIER)
-    
-    
-    
-    fatigue_penalty = attacker.consecutive_punches * config.PUNCH_FATIGUE_PENALTY
-    base_damage = int(base_damage * (1.0 - fatigue_penalty))
+    fatigue_penalty = streak * params.fatigue
     
     
     momentum_bonus = attacker.move_variety_bonus
     
     
     evade_bonus = 0.0
-    if attacker.has_status_effect('evade_bonus'):
+    if attacker.status_effect_bits & _EVADE_BONUS_BIT:
         evade_bonus = attacker.status_effects['evade_bonus'].get('bonus', 0.0)
     
-    base_damage = int(base_damage * (1.0 + momentum_bonus + evade_bonus))
+    damage_multiplier = params.mult * (1.0 - fatigue_penalty) * (1.0 + momentum_bonus + evade_bonus)
     
     
-    miss_chance = attacker.consecutive_punches * config.PUNCH_MISS_CHANCE_PER_FATIGUE
-    if miss_chance > 0 and random.random() < miss_chance:
+    miss_chance = params.miss_base + streak * params.miss_per
+    if miss_chance > 0 and _random() < miss_chance:
         return {
             'success': False,
-            'message': f"{attacker.name} punches but misses due to fatigue! ({int(miss_chance*100)}% miss chance)",
-            'stamina_cost': config.PUNCH_STAMINA_COST,
+            'message': params.miss_message.format(attacker.name, int(miss_chance*100)),
+            'stamina_cost': cost,
             'missed': True
         }
     
     
-    if config.DAMAGE_VARIANCE_ENABLED:
-        variance = random.uniform(
-            1 - config.DAMAGE_VARIANCE_PERCENT,
-            1 + config.DAMAGE_VARIANCE_PERCENT
-        )
-        base_damage = int(base_damage * variance)
+    if _var_on:
+        damage_multiplier *= _uniform(1 - _var, 1 + _var)
+    base_damage = int(attacker.base_damage * damage_multiplier)
     
     
     was_blocking = target.is_blocking
@@ -107,43 +151,34 @@ def punch(attacker, target):
         
         target.can_counter_attack = True
         
-        target.restore_stamina(config.BLOCK_STAMINA_RECOVERY)
+        target.restore_stamina(_block_recov)
     
     
     counter_damage = 0
     counter_msg = ""
     if (was_blocking or was_evading) and not blocked_completely and not evade_success:
-        if random.random() < config.PUNCH_COUNTER_RISK:
+        if _random() < params.counter:
             
-            counter_damage = int(target.base_damage * 0.8)  
+            counter_damage = target.counter_damage
             attacker.hp = max(0, attacker.hp - counter_damage)
             counter_msg = f" {target.name} counter-attacks for {counter_damage} damage!"
     
     
     is_crit = False
-    if random.random() < config.CRITICAL_HIT_CHANCE:
+    if _random() < _crit_chance:
         is_crit = True
-        crit_damage = int(actual_damage * (config.CRITICAL_HIT_MULTIPLIER - 1))
+        crit_damage = int(actual_damage * (_crit_mult - 1))
         target.hp = max(0, target.hp - crit_damage)
         actual_damage += crit_damage
     
-    crit_msg = " CRITICAL HIT!" if is_crit else ""
-    fatigue_msg = f" (fatigued: -{int(fatigue_penalty*100)}%)" if fatigue_penalty > 0 else ""
-    momentum_msg = f" (momentum: +{int(momentum_bonus*100)}%)" if momentum_bonus > 0 else ""
-    
-    
-    if blocked_completely:
-        damage_msg = f"{attacker.name} punches, but {target.name} completely blocks it! (+{config.BLOCK_STAMINA_RECOVERY} stamina){counter_msg}"
-    elif was_blocking and actual_damage < base_damage:
-        damage_msg = f"{attacker.name} punches {target.name} for {actual_damage} damage (blocked, reduced from {base_damage})!{fatigue_msg}{momentum_msg}{crit_msg}{counter_msg}"
-    else:
-        damage_msg = f"{attacker.name} punches {target.name} for {actual_damage} damage!{fatigue_msg}{momentum_msg}{crit_msg}{counter_msg}"
-    
     return {
         'success': True,
         'damage': actual_damage,
-        'message': damage_msg,
-        'stamina_cost': config.PUNCH_STAMINA_COST,
+        'message': "" if config.SILENT_MODE else _attack_message(
+            attacker, target, params.verb, actual_damage, base_damage, was_blocking,
+            blocked_completely, is_crit, fatigue_penalty, momentum_bonus, counter_msg
+        ),
+        'stamina_cost': cost,
         'critical': is_crit,
         'blocked': blocked_completely,
         'counter_damage': counter_damage,
@@ -151,6 +186,49 @@ def punch(attacker, target):
     }
 
 
+def _attack_message(attacker, target, verb, actual_damage, base_damage, was_blocking,
+                    blocked_completely, is_crit, fatigue_penalty, momentum_bonus, counter_msg,
+                    _block_recov=config.BLOCK_STAMINA_RECOVERY):
+    """
+    Build the message describing a punch or kick that connected.
+    
+    Returns:
+        str: Attack message
+    """
+    if blocked_completely:
+        return f"{attacker.name} {verb}, but {target.name} completely blocks it! (+{_block_recov} stamina){counter_msg}"
+    
+    crit_msg = " CRITICAL HIT!" if is_crit else ""
+    fatigue_msg = f" (fatigued: -{int(fatigue_penalty*100)}%)" if fatigue_penalty > 0 else ""
+    momentum_msg = f" (momentum: +{int(momentum_bonus*100)}%)" if momentum_bonus > 0 else ""
+    if was_blocking and actual_damage < base_damage:
+        return f"{attacker.name} {verb} {target.name} for {actual_damage} damage (blocked, reduced from {base_damage})!{fatigue_msg}{momentum_msg}{crit_msg}{counter_msg}"
+    return f"{attacker.name} {verb} {target.name} for {actual_damage} damage!{fatigue_msg}{momentum_msg}{crit_msg}{counter_msg}"
+
+
+def punch(attacker, target):
+    """
+    Execute a punch attack.
+    Now includes fatigue penalty and counter-attack risk.
+    
+    Args:
+        attacker: Character performing the punch
+        target: Character being attacked
+        
+    Returns:
+        dict: Result of the punch with damage, message, etc.
+    """
+    return _execute_attack(attacker, target, _PUNCH_PARAMS)
+
+
+_BLOCK_MESSAGE = (
+    "{} raises guard! Next attack will be reduced by "
+    f"{int(config.BLOCK_DAMAGE_REDUCTION * 100)}% or completely blocked "
+    f"({int(config.BLOCK_COMPLETE_BLOCK_CHANCE * 100)}% chance)!"
+)
+_EVADE_MESSAGE = f"{{}} prepares to dodge the next attack! (Next attack: +{int(config.EVADE_NEXT_TURN_BONUS*100)}% damage)"
+
+
 def block(character):
     """
     Execute a block action.
@@ -174,15 +252,7 @@ def block(character):
     character.stamina -= config.BLOCK_STAMINA_COST
     
     
-    character.consecutive_punches = 0
-    character.consecutive_kicks = 0
-    character.last_move = 'block'
-    
-    
-    character.move_variety_bonus = min(
-        config.MOMENTUM_MAX_BONUS,
-        character.move_variety_bonus + config.MOMENTUM_BONUS_PER_UNIQUE_MOVE
-    )
+    character.record_non_attack_move('block')
     
     
     character.is_blocking = True
@@ -190,7 +260,7 @@ def block(character):
     return {
         'success': True,
         'damage': 0,
-        'message': f"{character.name} raises guard! Next attack will be reduced by {int(config.BLOCK_DAMAGE_REDUCTION * 100)}% or completely blocked ({int(config.BLOCK_COMPLETE_BLOCK_CHANCE * 100)}% chance)!",
+        'message': "" if config.SILENT_MODE else _BLOCK_MESSAGE.format(character.name),
         'stamina_cost': config.BLOCK_STAMINA_COST,
         'blocking': True
     }
@@ -219,15 +289,7 @@ def evade(character):
     character.stamina -= config.EVADE_STAMINA_COST
     
     
-    character.consecutive_punches = 0
-    character.consecutive_kicks = 0
-    character.last_move = 'evade'
-    
-    
-    character.move_variety_bonus = min(
-        config.MOMENTUM_MAX_BONUS,
-        character.move_variety_bonus + config.MOMENTUM_BONUS_PER_UNIQUE_MOVE
-    )
+    character.record_non_attack_move('evade')
     
     
     character.is_evading = True
@@ -238,7 +300,7 @@ def evade(character):
     return {
         'success': True,
         'damage': 0,
-        'message': f"{character.name} prepares to dodge the next attack! (Next attack: +{int(config.EVADE_NEXT_TURN_BONUS*100)}% damage)",
+        'message': "" if config.SILENT_MODE else _EVADE_MESSAGE.format(character.name),
         'stamina_cost': config.EVADE_STAMINA_COST,
         'evading': True
     }
@@ -264,21 +326,17 @@ def rest(character):
     character.restore_hp(hp_restored)
     
     
-    character.consecutive_punches = 0
-    character.consecutive_kicks = 0
-    character.last_move = 'rest'
-    
+    character.record_non_attack_move('rest')
     
-    character.move_variety_bonus = min(
-        config.MOMENTUM_MAX_BONUS,
-        character.move_variety_bonus + config.MOMENTUM_BONUS_PER_UNIQUE_MOVE
-    )
-    
-    hp_msg = f" and {hp_restored} HP" if hp_restored > 0 else ""
+    if config.SILENT_MODE:
+        message = ""
+    else:
+        hp_msg = f" and {hp_restored} HP" if hp_restored > 0 else ""
+        message = f"{character.name} rests and restores {stamina_restored} stamina{hp_msg}! (Fatigue reset)"
     return {
         'success': True,
         'damage': 0,
-        'message': f"{character.name} rests and restores {stamina_restored} stamina{hp_msg}! (Fatigue reset)",
+        'message': message,
         'stamina_cost': config.REST_STAMINA_COST,
         'stamina_restored': stamina_restored,
         'hp_restored': hp_restored
@@ -297,134 +355,27 @@ def kick(attacker, target):
     Returns:
         dict: Result of the kick with damage, message, etc.
     """
-    
-    if attacker.stamina < config.KICK_STAMINA_COST:
-        return {
-            'success': False,
-            'message': f"{attacker.name} doesn't have enough stamina to kick!",
-            'stamina_cost': 0
-        }
-    
-    
-    attacker.stamina -= config.KICK_STAMINA_COST
-    
-    
-    if attacker.last_move == 'kick':
-        attacker.consecutive_kicks += 1
-    else:
-        attacker.consecutive_kicks = 1  
-    attacker.consecutive_punches = 0  
-    
-    attacker.last_move = 'kick'
-    
-    
-    was_evading = target.is_evading
-    evade_success = False
-    if was_evading:
-        evade_success = random.random() < config.EVADE_SUCCESS_CHANCE
-        if evade_success:
-            
-            target.can_counter_attack = True
-            
-            target.restore_stamina(config.EVADE_STAMINA_RECOVERY)
-            return {
-                'success': False,
-                'message': f"{target.name} evaded {attacker.name}'s kick! (+{config.EVADE_STAMINA_RECOVERY} stamina)",
-                'stamina_cost': config.KICK_STAMINA_COST,
-                'evaded': True,
-                'counter_opportunity': True
-            }
-    
-    
-    base_damage = int(attacker.base_damage * config.KICK_DAMAGE_MULTIPLIER)
-    
-    
-    fatigue_penalty = attacker.consecutive_kicks * config.KICK_FATIGUE_PENALTY
-    base_damage = int(base_damage * (1.0 - fatigue_penalty))
-    
-    
-    momentum_bonus = attacker.move_variety_bonus
-    
-    
-    evade_bonus = 0.0
-    if attacker.has_status_effect('evade_bonus'):
-        evade_bonus = attacker.status_effects['evade_bonus'].get('bonus', 0.0)
-    
-    base_damage = int(base_damage * (1.0 + momentum_bonus + evade_bonus))
-    
-    
-    total_miss_chance = config.KICK_BASE_MISS_CHANCE + (attacker.consecutive_kicks * config.KICK_MISS_CHANCE_PER_FATIGUE)
-    if random.random() < total_miss_chance:
-        return {
-            'success': False,
-            'message': f"{attacker.name} kicks but misses! ({int(total_miss_chance*100)}% miss chance)",
-            'stamina_cost': config.KICK_STAMINA_COST,
-            'missed': True
-        }
-    
-    
-    if config.DAMAGE_VARIANCE_ENABLED:
-        variance = random.uniform(
-            1 - config.DAMAGE_VARIANCE_PERCENT,
-            1 + config.DAMAGE_VARIANCE_PERCENT
-        )
-        base_damage = int(base_damage * variance)
-    
-    
-    was_blocking = target.is_blocking
-    blocked_completely = False
-    
-    
-    actual_damage = target.take_damage(base_damage)
-    
-    
-    if was_blocking and actual_damage == 0:
-        blocked_completely = True
-        
-        target.can_counter_attack = True
-        
-        target.restore_stamina(config.BLOCK_STAMINA_RECOVERY)
-    
-    
-    counter_damage = 0
-    counter_msg = ""
-    if (was_blocking or was_evading) and not blocked_completely and not evade_success:
-        if random.random() < config.KICK_COUNTER_RISK:
-            
-            counter_damage = int(target.base_damage * 0.8)  
-            attacker.hp = max(0, attacker.hp - counter_damage)
-            counter_msg = f" {target.name} counter-attacks for {counter_damage} damage!"
-    
-    
-    is_crit = False
-    if random.random() < config.CRITICAL_HIT_CHANCE:
-        is_crit = True
-        crit_damage = int(actual_damage * (config.CRITICAL_HIT_MULTIPLIER - 1))
-        target.hp = max(0, target.hp - crit_damage)
-        actual_damage += crit_damage
-    
-    crit_msg = " CRITICAL HIT!" if is_crit else ""
-    fatigue_msg = f" (fatigued: -{int(fatigue_penalty*100)}%)" if fatigue_penalty > 0 else ""
-    momentum_msg = f" (momentum: +{int(momentum_bonus*100)}%)" if momentum_bonus > 0 else ""
-    
-    
-    if blocked_completely:
-        damage_msg = f"{attacker.name} kicks, but {target.name} completely blocks it! (+{config.BLOCK_STAMINA_RECOVERY} stamina){counter_msg}"
-    elif was_blocking and actual_damage < base_damage:
-        damage_msg = f"{attacker.name} kicks {target.name} for {actual_damage} damage (blocked, reduced from {base_damage})!{fatigue_msg}{momentum_msg}{crit_msg}{counter_msg}"
-    else:
-        damage_msg = f"{attacker.name} kicks {target.name} for {actual_damage} damage!{fatigue_msg}{momentum_msg}{crit_msg}{counter_msg}"
-    
-    return {
-        'success': True,
-        'damage': actual_damage,
-        'message': damage_msg,
-        'stamina_cost': config.KICK_STAMINA_COST,
-        'critical': is_crit,
-        'blocked': blocked_completely,
-        'counter_damage': counter_damage,
-        'fatigue_penalty': fatigue_penalty
-    }
+    return _execute_attack(attacker, target, _KICK_PARAMS)
+
+
+_ATTACK_MOVES = {
+    'punch': punch,
+    'kick': kick
+}
+
+
+_SELF_MOVES = {
+    'block': block,
+    'evade': evade,
+    'rest': rest
+}
+
+
+_MISSING_TARGET_MESSAGES = {
+    'punch': "Punch requires a target!",
+    'kick': "Kick requires a target!",
+    'special': "Special move requires a target!"
+}
 
 
 def execute_move(move_type, attacker, target=None):
@@ -440,51 +391,80 @@ def execute_move(move_type, attacker, target=None):
     Returns:
         dict: Result of the move execution
     """
-    move_type = move_type.lower()
+    if move_type not in _VALID_MOVES:
+        move_type = move_type.lower()
     
-    if move_type == 'punch':
-        if target is None:
-            return {
-                'success': False,
-                'message': "Punch requires a target!",
-                'damage': 0
-            }
-        return punch(attacker, target)
-    
-    elif move_type == 'kick':
-        if target is None:
-            return {
-                'success': False,
-                'message': "Kick requires a target!",
-                'damage': 0
-            }
-        return kick(attacker, target)
+    self_move = _SELF_MOVES.get(move_type)
+    if self_move is not None:
+        return self_move(attacker)
     
-    elif move_type == 'block':
-        return block(attacker)
-    
-    elif move_type == 'evade':
-        return evade(attacker)
-    
-    elif move_type == 'rest':
-        return rest(attacker)
-    
-    elif move_type == 'special':
-        if target is None:
-            return {
-                'success': False,
-                'message': "Special move requires a target!",
-                'damage': 0
-            }
-        
-        return attacker.use_special_move_with_cooldown(target)
-    
-    else:
+    missing_target_message = _MISSING_TARGET_MESSAGES.get(move_type)
+    if missing_target_message is None:
         return {
             'success': False,
             'message': f"Unknown move type: {move_type}",
             'damage': 0
         }
+    
+    if target is None:
+        return {
+            'success': False,
+            'message': missing_target_message,
+            'damage': 0
+        }
+    
+    if move_type == 'special':
+        return attacker.use_special_move_with_cooldown(target)
+    
+    return _ATTACK_MOVES[move_type](attacker, target)
+
+
+_MOVE_INFO = MappingProxyType({name: MappingProxyType(info) for name, info in {
+    'punch': {
+        'name': 'Punch',
+        'stamina_cost': config.PUNCH_STAMINA_COST,
+        'description': 'Basic attack that deals moderate damage.',
+        'requires_target': True
+    },
+    'kick': {
+        'name': 'Kick',
+        'stamina_cost': config.KICK_STAMINA_COST,
+        'description': f'Powerful attack: {int(config.KICK_DAMAGE_MULTIPLIER * 100)}% damage but {int(config.KICK_BASE_MISS_CHANCE * 100)}% miss chance.',
+        'requires_target': True
+    },
+    'block': {
+        'name': 'Block',
+        'stamina_cost': config.BLOCK_STAMINA_COST,
+        'description': f'Defensive move: {int(config.BLOCK_DAMAGE_REDUCTION * 100)}% damage reduction or {int(config.BLOCK_COMPLETE_BLOCK_CHANCE * 100)}% chance to completely block.',
+        'requires_target': False
+    },
+    'evade': {
+        'name': 'Evade',
+        'stamina_cost': config.EVADE_STAMINA_COST,
+        'description': f'Dodge move with {int(config.EVADE_SUCCESS_CHANCE * 100)}% chance to avoid next attack.',
+        'requires_target': False
+    },
+    'special': {
+        'name': 'Special',
+        'stamina_cost': 'Varies',
+        'description': 'Character-specific unique move with high impact.',
+        'requires_target': True
+    },
+    'rest': {
+        'name': 'Rest',
+        'stamina_cost': 0,
+        'description': f'Rest and restore {int(config.REST_STAMINA_RESTORE_PERCENT * 100)}% of max stamina.',
+        'requires_target': False
+    }
+}.items()})
+
+
+_UNKNOWN_MOVE_INFO = MappingProxyType({
+    'name': 'Unknown',
+    'stamina_cost': 0,
+    'description': 'Unknown move type.',
+    'requires_target': False
+})
 
 
 def get_move_info(move_type):
@@ -495,55 +475,20 @@ def get_move_info(move_type):
         move_type: Type of move ('punch', 'kick', 'block', 'evade', 'rest', 'special')
         
     Returns:
-        dict: Information about the move (stamina cost, description, etc.)
+        Mapping: Read-only information about the move (stamina cost, description, etc.)
     """
-    move_type = move_type.lower()
-    
-    move_info = {
-        'punch': {
-            'name': 'Punch',
-            'stamina_cost': config.PUNCH_STAMINA_COST,
-            'description': 'Basic attack that deals moderate damage.',
-            'requires_target': True
-        },
-        'kick': {
-            'name': 'Kick',
-            'stamina_cost': config.KICK_STAMINA_COST,
-            'description': f'Powerful attack: {int(config.KICK_DAMAGE_MULTIPLIER * 100)}% damage but {int(config.KICK_BASE_MISS_CHANCE * 100)}% miss chance.',
-            'requires_target': True
-        },
-        'block': {
-            'name': 'Block',
-            'stamina_cost': config.BLOCK_STAMINA_COST,
-            'description': f'Defensive move: {int(config.BLOCK_DAMAGE_REDUCTION * 100)}% damage reduction or {int(config.BLOCK_COMPLETE_BLOCK_CHANCE * 100)}% chance to completely block.',
-            'requires_target': False
-        },
-        'evade': {
-            'name': 'Evade',
-            'stamina_cost': config.EVADE_STAMINA_COST,
-            'description': f'Dodge move with {int(config.EVADE_SUCCESS_CHANCE * 100)}% chance to avoid next attack.',
-            'requires_target': False
-        },
-        'special': {
-            'name': 'Special',
-            'stamina_cost': 'Varies',
-            'description': 'Character-specific unique move with high impact.',
-            'requires_target': True
-        },
-        'rest': {
-            'name': 'Rest',
-            'stamina_cost': 0,
-            'description': f'Rest and restore {int(config.REST_STAMINA_RESTORE_PERCENT * 100)}% of max stamina.',
-            'requires_target': False
-        }
-    }
-    
-    return move_info.get(move_type, {
-        'name': 'Unknown',
-        'stamina_cost': 0,
-        'description': 'Unknown move type.',
-        'requires_target': False
-    })
+    info = _MOVE_INFO.get(move_type)
+    if info is None:
+        info = _MOVE_INFO.get(move_type.lower(), _UNKNOWN_MOVE_INFO)
+    return info
+
+
+_STAMINA_MOVES = {
+    'punch': (config.PUNCH_STAMINA_COST, "Can perform punch"),
+    'kick': (config.KICK_STAMINA_COST, "Can perform kick"),
+    'block': (config.BLOCK_STAMINA_COST, "Can perform block"),
+    'evade': (config.EVADE_STAMINA_COST, "Can perform evade")
+}
 
 
 def can_perform_move(character, move_type):
@@ -557,41 +502,35 @@ def can_perform_move(character, move_type):
     Returns:
         tuple: (can_perform: bool, reason: str)
     """
-    move_type = move_type.lower()
-    
-    if move_type == 'punch':
-        if character.stamina < config.PUNCH_STAMINA_COST:
-            return False, f"Not enough stamina (need {config.PUNCH_STAMINA_COST}, have {character.stamina})"
-        return True, "Can perform punch"
-    
-    elif move_type == 'kick':
-        if character.stamina < config.KICK_STAMINA_COST:
-            return False, f"Not enough stamina (need {config.KICK_STAMINA_COST}, have {character.stamina})"
-        return True, "Can perform kick"
-    
-    elif move_type == 'block':
-        if character.stamina < config.BLOCK_STAMINA_COST:
-            return False, f"Not enough stamina (need {config.BLOCK_STAMINA_COST}, have {character.stamina})"
-        return True, "Can perform block"
+    if move_type not in _VALID_MOVES:
+        move_type = move_type.lower()
     
-    elif move_type == 'evade':
-        if character.stamina < config.EVADE_STAMINA_COST:
-            return False, f"Not enough stamina (need {config.EVADE_STAMINA_COST}, have {character.stamina})"
-        return True, "Can perform evade"
+    stamina_move = _STAMINA_MOVES.get(move_type)
+    if stamina_move is not None:
+        stamina_cost, ready_message = stamina_move
+        if character.stamina < stamina_cost:
+            return False, f"Not enough stamina (need {stamina_cost}, have {character.stamina})"
+        return True, ready_message
     
-    elif move_type == 'rest':
+    if move_type == 'rest':
         
         return True, "Can rest"
     
-    elif move_type == 'special':
+    if move_type == 'special':
         
         if not character.can_use_special():
             return False, f"On cooldown ({character.special_move_cooldown} turns remaining)"
         
         return True, "Special move available"
     
-    else:
-        return False, f"Unknown move type: {move_type}"
+    return False, f"Unknown move type: {move_type}"
+
+
+_STAMINA_TIERS = sorted({cost for cost, _ in _STAMINA_MOVES.values()})
+_AVAILABLE_BY_TIER = tuple(
+    tuple(move for move, (cost, _) in _STAMINA_MOVES.items() if cost <= affordable) + ('rest', 'special')
+    for affordable in [float('-inf')] + _STAMINA_TIERS
+)
 
 
 def get_available_moves(character):
@@ -604,25 +543,4 @@ def get_available_moves(character):
     Returns:
         list: List of available move types
     """
-    available = []
-    
-    if character.stamina >= config.PUNCH_STAMINA_COST:
-        available.append('punch')
-    
-    if character.stamina >= config.KICK_STAMINA_COST:
-        available.append('kick')
-    
-    if character.stamina >= config.BLOCK_STAMINA_COST:
-        available.append('block')
-    
-    if character.stamina >= config.EVADE_STAMINA_COST:
-        available.append('evade')
-    
-    
-    available.append('rest')
-    
-    
-    available.append('special')
-    
-    return available
-
+    return list(_AVAILABLE_BY_TIER[bisect.bisect_right(_STAMINA_TIERS, character.stamina)])
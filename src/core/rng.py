@@ -0,0 +1,55 @@
+"""
+Random rolls for combat moves.
+Selects the roll source named by config.RNG_MODE: the standard generator,
+or a quantized one that limits each roll to a few evenly spaced outcomes
+so lookahead searches branch over fewer cases.
+
+Every combat roll, including the block and special-move rolls in
+characters, comes from the random module's shared generator, so
+random.seed() (or reseed) replays a battle.
+"""
+
+import random as _stdlib_random
+from src.utils import config
+
+
+draw = _stdlib_random.random
+
+
+def reseed(seed=None):
+    """Reseed the shared generator behind every combat roll; same as random.seed()."""
+    _stdlib_random.seed(seed)
+
+
+def quantized_roll(_levels=config.RNG_QUANTIZATION_LEVELS, _randrange=_stdlib_random.randrange):
+    """
+    Draw one of a fixed set of evenly spaced pivots in [0, 1).
+    
+    Returns:
+        float: (i + 0.5) / levels for a uniformly chosen i
+    """
+    return (_randrange(_levels) + 0.5) / _levels
+
+
+def quantized_uniform(a, b):
+    """
+    Draw a quantized value between a and b.
+    
+    Args:
+        a: Lower bound
+        b: Upper bound
+        
+    Returns:
+        float: A value between a and b at one of the quantization pivots
+    """
+    return a + (b - a) * quantized_roll()
+
+
+if config.RNG_MODE == 'stdlib':
+    roll = _stdlib_random.random
+    uniform = _stdlib_random.uniform
+elif config.RNG_MODE == 'quantized':
+    roll = quantized_roll
+    uniform = quantized_uniform
+else:
+    raise ValueError(f"Unknown RNG mode: {config.RNG_MODE}")
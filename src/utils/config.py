@@ -1,3 +1,5 @@
+import os
+from types import MappingProxyType
 
 
 PUNCH_DAMAGE_MULTIPLIER = 1.0  
@@ -29,6 +31,9 @@ EVADE_STAMINA_RECOVERY = 3
 EVADE_NEXT_TURN_BONUS = 0.15  
 
 
+COUNTER_DAMAGE_SCALE = 0.8  
+
+
 SPECIAL_MOVE_MIN_STAMINA_COST = 20
 SPECIAL_MOVE_MAX_STAMINA_COST = 40
 
@@ -73,6 +78,16 @@ STATUS_EFFECT_TYPES = {
 }
 
 
+STATUS_EFFECT_BITS = {
+    'poison': 1,
+    'burn': 2,
+    'stun': 4,
+    'bleed': 8,
+    'evade_bonus': 16
+}
+STATUS_EFFECT_OTHER_BIT = 32
+
+
 AI_HEALTH_THRESHOLDS = {
     'WOUNDED': 0.5,        
     'DESPERATION': 0.2,    
@@ -91,7 +106,16 @@ DIFFICULTY_EASY = 'easy'
 DIFFICULTY_MEDIUM = 'medium'
 DIFFICULTY_HARD = 'hard'
 
-DIFFICULTY_MODIFIERS = {
+
+def _freeze(table):
+    """Wrap a nested dict table in read-only mapping proxies, level by level."""
+    return MappingProxyType({
+        key: _freeze(value) if isinstance(value, dict) else value
+        for key, value in table.items()
+    })
+
+
+DIFFICULTY_MODIFIERS = _freeze({
     DIFFICULTY_EASY: {
         
         'aggressive': {'punch': 0.5, 'kick': 0.4, 'special': 0.4, 'block': 1.6, 'evade': 1.5, 'rest': 1.5},  
@@ -122,7 +146,7 @@ DIFFICULTY_MODIFIERS = {
         'exhausted': {'punch': 1.3, 'kick': 1.2, 'special': 1.2, 'block': 0.6, 'evade': 0.7, 'rest': 0.5},  
         'finisher': {'punch': 1.4, 'kick': 1.4, 'special': 1.9, 'block': 0.3, 'evade': 0.4, 'rest': 0.3}  
     }
-}
+})
 
 
 AI_ACTION_WEIGHTS = {
@@ -177,6 +201,17 @@ AI_ACTION_WEIGHTS = {
     }
 }
 
+
+def _normalized(weights):
+    """Scale a state's action weights to sum to 1.0, rejecting tables that are clearly off."""
+    total = sum(weights.values())
+    if abs(total - 1.0) > 0.05:
+        raise ValueError(f"AI action weights sum to {total}, expected 1.0")
+    return {action: weight / total for action, weight in weights.items()}
+
+
+AI_ACTION_WEIGHTS = _freeze({state: _normalized(weights) for state, weights in AI_ACTION_WEIGHTS.items()})
+
 PLAYER_TURN_FIRST = True  
 
 
@@ -209,15 +244,15 @@ TURN_SEPARATOR = "=" * 60
 ACTION_SEPARATOR = "-" * 60
 
 
-VALID_MOVES = ['punch', 'kick', 'block', 'evade', 'special', 'rest']
+VALID_MOVES = frozenset(['punch', 'kick', 'block', 'evade', 'special', 'rest'])
 
 
-VALID_CHARACTER_NAMES = [
+VALID_CHARACTER_NAMES = frozenset([
     'warrior', 'tank', 'assassin', 'mage', 'samurai'
-]
+])
 
 
-VALID_DIFFICULTY_LEVELS = [DIFFICULTY_EASY, DIFFICULTY_MEDIUM, DIFFICULTY_HARD]
+VALID_DIFFICULTY_LEVELS = frozenset([DIFFICULTY_EASY, DIFFICULTY_MEDIUM, DIFFICULTY_HARD])
 
 
 
@@ -232,6 +267,25 @@ CRITICAL_HIT_MULTIPLIER = 1.5
 DEBUG_MODE = False
 
 
+HEADLESS = os.environ.get('FIGHTER_HEADLESS') == '1'
+
+
+ASCII_BARS = os.environ.get('FIGHTER_ASCII') == '1'
+
+
+SILENT_MODE = False
+
+
+EAGER_FUZZY_INIT = True
+
+
+FUZZY_INPUT_QUANTIZATION = 0  
+
+
+RNG_MODE = 'stdlib'  
+RNG_QUANTIZATION_LEVELS = 8  
+
+
 LOG_LEVEL = 'INFO'  
 
 
@@ -3,10 +3,24 @@ Utility functions for the Turn-Based Fighter Game.
 Contains helper functions for formatting, logging, weighted choices, and display.
 """
 
+import os
 import random
+import sys
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
 from src.utils import config
 
 
+_LOG_LEVELS = {'DEBUG': 0, 'INFO': 1, 'WARNING': 2, 'ERROR': 3}
+_current_log_level = _LOG_LEVELS[config.LOG_LEVEL]
+_CLEAR_COMMAND = 'cls' if os.name == 'nt' else 'clear'
+_TURN_SEPARATOR_LINE = config.TURN_SEPARATOR + '\n'
+_ACTION_SEPARATOR_LINE = config.ACTION_SEPARATOR + '\n'
+_BAR_FILLED, _BAR_EMPTY = ('#', '.') if config.ASCII_BARS else ('█', '░')
+_EFFECT_LABELS = {effect_type: effect_type.capitalize() for effect_type in config.STATUS_EFFECT_BITS}
+
+
 def weighted_choice(choices):
     """
     Select an item from a dictionary of choices based on weights.
@@ -20,23 +34,30 @@ def weighted_choice(choices):
     if not choices:
         return None
     
-    items = list(choices.items())
-    choices_list = [item[0] for item in items]
-    weights = [item[1] for item in items]
-    
-    
-    total_weight = sum(weights)
-    if total_weight == 0:
+    keys = tuple(choices)
+    cumulative = tuple(accumulate(choices.values()))
+    if cumulative[-1] == 0:
         
-        return random.choice(choices_list)
-    
-    normalized_weights = [w / total_weight for w in weights]
+        return keys[random.randrange(len(keys))]
     
+    return weighted_choice_fast(keys, cumulative)
+
+
+def weighted_choice_fast(keys, cumulative, _random=random.random):
+    """
+    Select an item using precomputed cumulative weights.
     
-    return random.choices(choices_list, weights=normalized_weights, k=1)[0]
+    Args:
+        keys: Sequence of choices
+        cumulative: Running totals of the choices' weights, last one positive
+        
+    Returns:
+        Selected choice
+    """
+    return keys[bisect_right(cumulative, _random() * cumulative[-1], 0, len(cumulative) - 1)]
 
 
-def create_bar(current, maximum, length, filled_char='█', empty_char='░'):
+def create_bar(current, maximum, length, filled_char=_BAR_FILLED, empty_char=_BAR_EMPTY):
     """
     Create a visual bar representation of a value.
     
@@ -44,8 +65,8 @@ def create_bar(current, maximum, length, filled_char='█', empty_char='░'):
         current: Current value
         maximum: Maximum value
         length: Length of the bar in characters
-        filled_char: Character to use for filled portion
-        empty_char: Character to use for empty portion
+        filled_char: Character to use for filled portion (ASCII '#' when config.ASCII_BARS)
+        empty_char: Character to use for empty portion (ASCII '.' when config.ASCII_BARS)
         
     Returns:
         str: Bar representation
@@ -53,11 +74,20 @@ def create_bar(current, maximum, length, filled_char='█', empty_char='░'):
     if maximum == 0:
         return empty_char * length
     
-    filled_length = int((current / maximum) * length)
-    filled_length = max(0, min(filled_length, length))  
+    filled_length = int((current * length) // maximum)
+    if filled_length < 0:
+        filled_length = 0
+    elif filled_length > length:
+        filled_length = length
     
-    bar = filled_char * filled_length + empty_char * (length - filled_length)
-    return bar
+    filled, empty = _bar_templates(filled_char, empty_char, length)
+    return filled[:filled_length] + empty[filled_length:]
+
+
+@lru_cache(maxsize=16)
+def _bar_templates(filled_char, empty_char, length):
+    """Full-length filled and empty strings for create_bar to slice."""
+    return filled_char * length, empty_char * length
 
 
 def format_hp_bar(character):
@@ -98,27 +128,23 @@ def format_character_status(character):
     Returns:
         str: Formatted character status
     """
-    hp_bar = format_hp_bar(character)
-    stamina_bar = format_stamina_bar(character)
+    status = f"{character.name}:\n  {format_hp_bar(character)}\n  {format_stamina_bar(character)}"
     
-    status = f"{character.name}:\n  {hp_bar}\n  {stamina_bar}"
     
-    
-    if character.status_effects:
-        effects = ", ".join(character.status_effects.keys())
-        status += f"\n  Status Effects: {effects}"
+    if character.status_effect_names:
+        status += f"\n  Status Effects: {character.status_effect_names}"
     
     return status
 
 
 def print_turn_separator():
     """Print a separator line for turn display."""
-    print(config.TURN_SEPARATOR)
+    sys.stdout.write(_TURN_SEPARATOR_LINE)
 
 
 def print_action_separator():
     """Print a separator line for action display."""
-    print(config.ACTION_SEPARATOR)
+    sys.stdout.write(_ACTION_SEPARATOR_LINE)
 
 
 def format_move_result(result):
@@ -159,16 +185,17 @@ def log_message(message, level='INFO'):
     if not config.DEBUG_MODE and level == 'DEBUG':
         return
     
-    
-    levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR']
-    current_level_index = levels.index(config.LOG_LEVEL)
-    message_level_index = levels.index(level)
-    
-    if message_level_index >= current_level_index:
+    if _LOG_LEVELS[level] >= _current_log_level:
         prefix = f"[{level}]" if config.DEBUG_MODE else ""
         print(f"{prefix} {message}")
 
 
+def refresh_log_level():
+    """Re-read config.LOG_LEVEL after it has been changed at runtime."""
+    global _current_log_level
+    _current_log_level = _LOG_LEVELS[config.LOG_LEVEL]
+
+
 def debug_print(message):
     """
     Print debug message if debug mode is enabled.
@@ -196,6 +223,8 @@ def format_percentage(value, maximum, decimals=1):
         return "0.0%"
     
     percentage = (value / maximum) * 100
+    if decimals == 1:
+        return f"{percentage:.1f}%"
     return f"{percentage:.{decimals}f}%"
 
 
@@ -273,8 +302,7 @@ def format_battle_summary(player, ai, ai_controller):
 
 def clear_screen():
     """Clear the console screen (cross-platform)."""
-    import os
-    os.system('cls' if os.name == 'nt' else 'clear')
+    os.system(_CLEAR_COMMAND)
 
 
 def print_centered(text, width=60):
@@ -307,13 +335,10 @@ def format_status_effects(character):
         turns = effect_data.get('turns', 0)
         damage = effect_data.get('damage', 0)
         
-        effect_str = effect_type.capitalize()
-        if turns > 0:
-            effect_str += f" ({turns} turns)"
-        if damage > 0:
-            effect_str += f" [{damage} dmg/turn]"
-        
-        effects.append(effect_str)
+        label = _EFFECT_LABELS.get(effect_type) or effect_type.capitalize()
+        turns_str = f" ({turns} turns)" if turns > 0 else ""
+        damage_str = f" [{damage} dmg/turn]" if damage > 0 else ""
+        effects.append(f"{label}{turns_str}{damage_str}")
     
     return ", ".join(effects)
 
@@ -324,12 +349,16 @@ def get_user_input(prompt, valid_options=None, case_sensitive=False):
     
     Args:
         prompt: Prompt to display
-        valid_options: List of valid options (None for any input)
+        valid_options: Iterable of valid options (None for any input)
         case_sensitive: Whether to check case
         
     Returns:
         str: User input
     """
+    if valid_options is not None:
+        valid_options = dict.fromkeys(valid_options if case_sensitive else (opt.lower() for opt in valid_options))
+        invalid_message = f"Invalid input. Please choose from: {', '.join(valid_options)}"
+    
     while True:
         user_input = input(prompt).strip()
         
@@ -342,10 +371,9 @@ def get_user_input(prompt, valid_options=None, case_sensitive=False):
         
         if not case_sensitive:
             user_input = user_input.lower()
-            valid_options = [opt.lower() for opt in valid_options]
         
         if user_input in valid_options:
             return user_input
         
-        print(f"Invalid input. Please choose from: {', '.join(valid_options)}")
+        print(invalid_message)
 